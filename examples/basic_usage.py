@@ -6,9 +6,17 @@ This file demonstrates basic usage patterns for the PDF to CSV data processor.
 Run these examples to understand how to use the library programmatically.
 """
 
+import io
+import logging
+import os
 import sys
+from collections import deque
+from concurrent.futures import (ProcessPoolExecutor, ThreadPoolExecutor,
+                                FIRST_COMPLETED, wait)
 from pathlib import Path
 
+import PyPDF2
+
 # Add the src directory to the path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -18,18 +26,139 @@ from src.core.config_manager import ConfigManager
 from src.utils.file_handler import FileHandler
 from src.utils.logger import setup_logger
 
+# Batch progress goes through a buffered stderr handler so large runs
+# do one write() per ~64 KiB instead of one syscall per print()
+class _BufferedStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler without the per-record flush
+
+    The stock emit() calls self.flush() after every record, which
+    drains the TextIOWrapper and the BufferedWriter below it - one
+    write syscall per line no matter how big the buffer is. Records
+    here stay buffered until flush() is called explicitly (every 100
+    files during a batch run, and once when the run ends).
+    """
+
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+_progress = logging.getLogger('batch.progress')
+if not _progress.handlers:
+    _progress_stream = io.TextIOWrapper(
+        io.BufferedWriter(io.FileIO(sys.stderr.fileno(), 'w', closefd=False), 64 << 10),
+        write_through=False
+    )
+    _progress_handler = _BufferedStreamHandler(_progress_stream)
+    _progress_handler.setFormatter(logging.Formatter('%(message)s'))
+    _progress.addHandler(_progress_handler)
+    _progress.setLevel(logging.INFO)
+    _progress.propagate = False
+
+# The six examples run concurrently, so bare print() from different
+# threads interleaves mid-line; routing output through a logger
+# serializes each line on the handler's lock
+_console = logging.getLogger('examples.console')
+if not _console.handlers:
+    _console_handler = logging.StreamHandler(sys.stdout)
+    _console_handler.setFormatter(logging.Formatter('%(message)s'))
+    _console.addHandler(_console_handler)
+    _console.setLevel(logging.INFO)
+    _console.propagate = False
+
+def _say(message=""):
+    """print() replacement serialized through the console logger"""
+    _console.info(message)
+
+# Component cache keyed by config path, so the six examples share one
+# ConfigManager/PDFExtractor/CSVConverter instead of re-parsing config
+# and re-probing extraction backends per example
+_components = {}
+
+def _get_components(config_path=None):
+    """
+    Get shared processing components, building them on first use
+
+    Args:
+        config_path: Optional path to a custom config file
+
+    Returns:
+        Tuple of (config, extractor, converter, file_handler)
+    """
+    if config_path not in _components:
+        config = ConfigManager(config_path) if config_path else ConfigManager()
+        _components[config_path] = (
+            config,
+            PDFExtractor(config),
+            CSVConverter(config),
+            FileHandler()
+        )
+    return _components[config_path]
+
+def _process_one(pdf_path, output_dir, config_settings=None, csv_path=None):
+    """
+    Worker function: process a single PDF in a separate process
+
+    Rebuilds the processing components locally (they are not picklable),
+    runs the extract -> convert -> save chain and reports the outcome.
+
+    Args:
+        pdf_path: Path to the PDF file
+        output_dir: Directory for the output CSV
+        config_settings: Optional plain-dict configuration to apply
+        csv_path: Optional precomputed output path (skips filename work)
+
+    Returns:
+        Tuple of (pdf_path, success, error_message)
+    """
+    try:
+        config = ConfigManager()
+        if config_settings:
+            config.update_settings(config_settings)
+
+        extractor = PDFExtractor(config)
+        converter = CSVConverter(config)
+        file_handler = FileHandler()
+
+        # Extract data
+        extracted_data = extractor.extract_data(pdf_path)
+
+        tables = (extracted_data.get('tables') or ()) if extracted_data else ()
+        if not len(tables):
+            return (pdf_path, False, "No data extracted")
+
+        # Generate output filename unless the caller precomputed it
+        if csv_path is None:
+            pdf_name = Path(pdf_path).stem
+            csv_filename = file_handler.get_safe_filename(f"{pdf_name}.csv")
+            csv_path = str(Path(output_dir) / csv_filename)
+
+        # Stream the CSV straight to disk
+        with open(csv_path, 'wb', buffering=1 << 20) as f:
+            rows_written = converter.write_csv(extracted_data, f)
+
+        if rows_written:
+            return (pdf_path, True, None)
+        else:
+            return (pdf_path, False, "Failed to save CSV")
+
+    except Exception as e:
+        return (pdf_path, False, str(e))
+
 def basic_pdf_to_csv_conversion():
     """Example 1: Basic PDF to CSV conversion"""
-    print("="*60)
-    print("Example 1: Basic PDF to CSV Conversion")
-    print("="*60)
-    
-    # Initialize components
-    config = ConfigManager()
-    extractor = PDFExtractor(config)
-    converter = CSVConverter(config)
-    file_handler = FileHandler()
+    _say("="*60)
+    _say("Example 1: Basic PDF to CSV Conversion")
+    _say("="*60)
     
+    # Initialize components (shared across examples)
+    config, extractor, converter, file_handler = _get_components()
+
     # Example PDF file path (replace with your PDF)
     pdf_path = "sample_data.pdf"
     output_path = "output_data.csv"
@@ -37,51 +166,38 @@ def basic_pdf_to_csv_conversion():
     try:
         # Step 1: Validate PDF
         if not file_handler.validate_pdf(pdf_path):
-            print(f"❌ Invalid PDF file: {pdf_path}")
-            print("Please ensure you have a valid PDF file to process.")
-            return
-        
-        # Step 2: Extract data from PDF
-        print(f"📄 Processing PDF: {pdf_path}")
-        extracted_data = extractor.extract_data(pdf_path)
-        
-        if not extracted_data or not extracted_data.get('tables'):
-            print("❌ No data extracted from PDF")
+            _say(f"❌ Invalid PDF file: {pdf_path}")
+            _say("Please ensure you have a valid PDF file to process.")
             return
         
-        print(f"✅ Extracted {len(extracted_data['tables'])} tables")
-        print(f"   Total rows: {extracted_data.get('total_rows', 0)}")
-        print(f"   Total columns: {extracted_data.get('total_columns', 0)}")
-        
-        # Step 3: Convert to CSV
-        print("🔄 Converting to CSV...")
-        csv_data = converter.convert_to_csv(extracted_data)
-        
-        # Step 4: Save CSV file
-        success = file_handler.save_csv(csv_data, output_path)
-        
-        if success:
-            print(f"✅ CSV saved successfully: {output_path}")
+        # Steps 2-4 fused: stream rows from the extractor straight into
+        # the CSV writer, one page of tables in memory at a time
+        _say(f"📄 Processing PDF: {pdf_path}")
+        _say("🔄 Converting to CSV...")
+        with open(output_path, 'wb', buffering=1 << 20) as f:
+            rows_written = converter.write_rows(extractor.iter_rows(pdf_path), f)
+
+        if rows_written:
+            _say(f"✅ CSV saved successfully: {output_path}")
+            _say(f"   Rows written: {rows_written}")
         else:
-            print("❌ Failed to save CSV file")
+            _say("❌ No data extracted from PDF")
     
     except FileNotFoundError:
-        print(f"❌ PDF file not found: {pdf_path}")
-        print("Please create a sample PDF file or modify the path.")
+        _say(f"❌ PDF file not found: {pdf_path}")
+        _say("Please create a sample PDF file or modify the path.")
     except Exception as e:
-        print(f"❌ Error: {str(e)}")
+        _say(f"❌ Error: {str(e)}")
 
 def advanced_extraction_with_options():
     """Example 2: Advanced extraction with custom options"""
-    print("="*60)
-    print("Example 2: Advanced Extraction with Options")
-    print("="*60)
-    
-    # Load custom configuration
-    config = ConfigManager("examples/sample_config.json")
-    extractor = PDFExtractor(config)
-    converter = CSVConverter(config)
+    _say("="*60)
+    _say("Example 2: Advanced Extraction with Options")
+    _say("="*60)
     
+    # Load custom configuration (cached per config path)
+    config, extractor, converter, file_handler = _get_components("examples/sample_config.json")
+
     pdf_path = "sample_report.pdf"
     
     try:
@@ -93,14 +209,15 @@ def advanced_extraction_with_options():
             'lattice': True      # Use lattice detection
         }
         
-        print(f"📄 Processing PDF with custom options: {pdf_path}")
+        _say(f"📄 Processing PDF with custom options: {pdf_path}")
         extracted_data = extractor.extract_data(pdf_path, **extraction_options)
         
-        if extracted_data and extracted_data.get('tables'):
-            print(f"✅ Extraction successful!")
-            print(f"   Method used: {extracted_data.get('method', 'unknown')}")
-            print(f"   Pages processed: {extracted_data.get('pages', 'all')}")
-            print(f"   Tables found: {len(extracted_data['tables'])}")
+        tables = (extracted_data.get('tables') or ()) if extracted_data else ()
+        if len(tables):
+            _say(f"✅ Extraction successful!")
+            _say(f"   Method used: {extracted_data.get('method', 'unknown')}")
+            _say(f"   Pages processed: {extracted_data.get('pages', 'all')}")
+            _say(f"   Tables found: {len(tables)}")
             
             # Convert with custom CSV options
             csv_options = {
@@ -110,160 +227,196 @@ def advanced_extraction_with_options():
                 'clean_data': True     # Clean the data
             }
             
-            csv_data = converter.convert_to_csv(extracted_data, **csv_options)
-            
-            # Save with custom filename
+            # Save with custom filename, streaming straight to disk
             output_path = f"advanced_output_{extraction_options['method']}.csv"
-            FileHandler().save_csv(csv_data, output_path)
-            print(f"✅ Advanced CSV saved: {output_path}")
+            with open(output_path, 'wb', buffering=1 << 20) as f:
+                converter.write_csv(extracted_data, f, **csv_options)
+            _say(f"✅ Advanced CSV saved: {output_path}")
         
         else:
-            print("❌ No data extracted")
+            _say("❌ No data extracted")
     
     except FileNotFoundError:
-        print(f"❌ PDF file not found: {pdf_path}")
-        print("This is expected if you don't have the sample file.")
+        _say(f"❌ PDF file not found: {pdf_path}")
+        _say("This is expected if you don't have the sample file.")
     except Exception as e:
-        print(f"❌ Error: {str(e)}")
+        _say(f"❌ Error: {str(e)}")
 
-def batch_processing_example():
+def batch_processing_example(max_workers=None, max_concurrent_results=32):
     """Example 3: Batch processing multiple PDFs"""
-    print("="*60)
-    print("Example 3: Batch Processing Multiple PDFs")
-    print("="*60)
-    
-    config = ConfigManager()
-    extractor = PDFExtractor(config)
-    converter = CSVConverter(config)
-    file_handler = FileHandler()
-    
+    _say("="*60)
+    _say("Example 3: Batch Processing Multiple PDFs")
+    _say("="*60)
+
+    _, _, _, file_handler = _get_components()
+
     # Directory containing PDF files
     input_dir = "sample_pdfs"
     output_dir = "batch_output"
-    
+
     try:
         # Find all PDF files
         pdf_files = file_handler.find_pdf_files(input_dir, recursive=True)
-        
+
         if not pdf_files:
-            print(f"❌ No PDF files found in: {input_dir}")
-            print("Please create a directory with sample PDF files.")
+            _say(f"❌ No PDF files found in: {input_dir}")
+            _say("Please create a directory with sample PDF files.")
             return
-        
-        print(f"📁 Found {len(pdf_files)} PDF files to process")
-        
+
+        _say(f"📁 Found {len(pdf_files)} PDF files to process")
+
         # Create output directory
         output_path = file_handler.create_output_directory(output_dir, create_timestamp_dir=True)
-        
+
+        # Extraction is CPU-bound per file, so fan out across processes
+        max_workers = max_workers or os.cpu_count()
+        _say(f"⚙️  Processing with {max_workers} worker processes")
+
+        # Precompute per-file names and output paths once instead of
+        # rebuilding Path objects for every processed file; a single
+        # Path per source file serves both .name and .stem
+        out_parent = Path(output_path)
+        paths = [Path(p) for p in pdf_files]
+        names = [p.name for p in paths]
+        stems = [p.stem for p in paths]
+        safe_csvs = [file_handler.get_safe_filename(f"{s}.csv") for s in stems]
+        csv_paths = [str(out_parent / c) for c in safe_csvs]
+        total = len(pdf_files)
+
         success_count = 0
-        
-        for i, pdf_path in enumerate(pdf_files, 1):
-            try:
-                print(f"\n🔄 Processing {i}/{len(pdf_files)}: {Path(pdf_path).name}")
-                
-                # Extract data
-                extracted_data = extractor.extract_data(pdf_path)
-                
-                if extracted_data and extracted_data.get('tables'):
-                    # Convert to CSV
-                    csv_data = converter.convert_to_csv(extracted_data)
-                    
-                    # Generate output filename
-                    pdf_name = Path(pdf_path).stem
-                    csv_filename = file_handler.get_safe_filename(f"{pdf_name}.csv")
-                    csv_path = Path(output_path) / csv_filename
-                    
-                    # Save CSV
-                    if file_handler.save_csv(csv_data, str(csv_path)):
-                        success_count += 1
-                        print(f"   ✅ Success: {csv_filename}")
-                    else:
-                        print(f"   ❌ Failed to save: {csv_filename}")
-                else:
-                    print(f"   ⚠️  No data extracted")
-            
-            except Exception as e:
-                print(f"   ❌ Error processing {Path(pdf_path).name}: {str(e)}")
-        
-        print(f"\n📊 Batch processing complete:")
-        print(f"   Total files: {len(pdf_files)}")
-        print(f"   Successful: {success_count}")
-        print(f"   Failed: {len(pdf_files) - success_count}")
-        print(f"   Output directory: {output_path}")
+        completed = 0
+
+        # Bounded submission: keep only max_concurrent_results futures in
+        # flight so memory stays flat regardless of corpus size
+        pending = deque(range(len(pdf_files)))
+        in_flight = {}
+
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                while pending or in_flight:
+                    # Top up the in-flight window
+                    while pending and len(in_flight) < max_concurrent_results:
+                        i = pending.popleft()
+                        future = executor.submit(_process_one, pdf_files[i], output_path,
+                                                 csv_path=csv_paths[i])
+                        in_flight[future] = i
+
+                    # Drain at least one finished result before submitting more
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        i = in_flight.pop(future)
+                        completed += 1
+                        _, success, error = future.result()
+
+                        _progress.info(f"🔄 Completed {completed}/{total}: {names[i]}")
+
+                        if success:
+                            success_count += 1
+                            _progress.info(f"   ✅ Success: {safe_csvs[i]}")
+                        else:
+                            _progress.info(f"   ❌ {error}")
+
+                        # Flush the buffered handler periodically so
+                        # progress stays visible on long runs
+                        if completed % 100 == 0:
+                            _progress_handler.flush()
+        finally:
+            _progress_handler.flush()
+
+        _say(f"\n📊 Batch processing complete:")
+        _say(f"   Total files: {len(pdf_files)}")
+        _say(f"   Successful: {success_count}")
+        _say(f"   Failed: {len(pdf_files) - success_count}")
+        _say(f"   Output directory: {output_path}")
     
     except Exception as e:
-        print(f"❌ Batch processing error: {str(e)}")
+        _say(f"❌ Batch processing error: {str(e)}")
 
-def preview_extraction_example():
-    """Example 4: Preview extraction before saving"""
-    print("="*60)
-    print("Example 4: Preview Extraction Before Saving")
-    print("="*60)
-    
-    config = ConfigManager()
-    extractor = PDFExtractor(config)
-    converter = CSVConverter(config)
+def preview_extraction_example(auto_save=None):
+    """
+    Example 4: Preview extraction before saving
+
+    Args:
+        auto_save: Save without prompting (None = prompt only when stdin
+            is an interactive TTY, so CI/batch runs never block)
+    """
+    _say("="*60)
+    _say("Example 4: Preview Extraction Before Saving")
+    _say("="*60)
     
+    config, extractor, converter, file_handler = _get_components()
+
     pdf_path = "sample_preview.pdf"
     
     try:
-        print(f"📄 Previewing extraction from: {pdf_path}")
+        _say(f"📄 Previewing extraction from: {pdf_path}")
         
         # Extract data for preview
         extracted_data = extractor.extract_data(pdf_path, preview_only=True)
         
-        if extracted_data and extracted_data.get('tables'):
-            print(f"✅ Preview successful!")
-            print(f"   Tables found: {len(extracted_data['tables'])}")
-            print(f"   Total rows: {extracted_data.get('total_rows', 0)}")
-            print(f"   Method used: {extracted_data.get('method', 'auto')}")
+        tables = (extracted_data.get('tables') or ()) if extracted_data else ()
+        if len(tables):
+            _say(f"✅ Preview successful!")
+            _say(f"   Tables found: {len(tables)}")
+            _say(f"   Total rows: {extracted_data.get('total_rows', 0)}")
+            _say(f"   Method used: {extracted_data.get('method', 'auto')}")
             
             # Generate CSV preview
             preview_info = converter.preview_csv(extracted_data, preview_rows=5)
             
-            print(f"\n📋 CSV Preview (first 5 rows):")
-            print("-" * 50)
-            print(preview_info.get('preview', 'No preview available'))
-            print("-" * 50)
-            print(f"Total columns: {preview_info.get('column_count', 0)}")
-            print(f"Column names: {preview_info.get('columns', [])}")
+            _say(f"\n📋 CSV Preview (first 5 rows):")
+            _say("-" * 50)
+            _say(preview_info.get('preview', 'No preview available'))
+            _say("-" * 50)
+            _say(f"Total columns: {preview_info.get('column_count', 0)}")
+            _say(f"Column names: {preview_info.get('columns', [])}")
             
-            # Ask user if they want to save
-            response = input("\n💾 Save full CSV? (y/n): ").lower().strip()
-            if response == 'y':
-                csv_data = converter.convert_to_csv(extracted_data)
+            # Ask user if they want to save - but never block when
+            # running non-interactively (CI, piped input)
+            if auto_save is None:
+                if sys.stdin.isatty():
+                    auto_save = input("\n💾 Save full CSV? (y/n): ").lower().strip() == 'y'
+                else:
+                    auto_save = False
+
+            if auto_save:
                 output_path = "previewed_output.csv"
-                if FileHandler().save_csv(csv_data, output_path):
-                    print(f"✅ Full CSV saved: {output_path}")
+                with open(output_path, 'wb', buffering=1 << 20) as f:
+                    rows_written = converter.write_csv(extracted_data, f)
+                if rows_written:
+                    _say(f"✅ Full CSV saved: {output_path}")
                 else:
-                    print("❌ Failed to save CSV")
+                    _say("❌ Failed to save CSV")
             else:
-                print("📝 Preview only - no file saved")
+                _say("📝 Preview only - no file saved")
         
         else:
-            print("❌ No data found for preview")
+            _say("❌ No data found for preview")
     
     except FileNotFoundError:
-        print(f"❌ PDF file not found: {pdf_path}")
-        print("This is expected if you don't have the sample file.")
+        _say(f"❌ PDF file not found: {pdf_path}")
+        _say("This is expected if you don't have the sample file.")
     except Exception as e:
-        print(f"❌ Preview error: {str(e)}")
+        _say(f"❌ Preview error: {str(e)}")
 
 def configuration_examples():
     """Example 5: Working with different configurations"""
-    print("="*60)
-    print("Example 5: Configuration Examples")
-    print("="*60)
+    _say("="*60)
+    _say("Example 5: Configuration Examples")
+    _say("="*60)
     
-    # Example 1: Default configuration
-    print("🔧 Default Configuration:")
+    # Example 1: Default configuration (flat snapshot - one dict hash
+    # per lookup instead of a dotted-path walk)
+    _say("🔧 Default Configuration:")
     default_config = ConfigManager()
-    print(f"   Extraction method: {default_config.get('extraction_method')}")
-    print(f"   Output delimiter: {default_config.get('output_format.delimiter')}")
-    print(f"   Clean data: {default_config.get('processing.clean_data')}")
+    snap = default_config.snapshot()
+    _say(f"   Extraction method: {snap.get('extraction_method')}")
+    _say(f"   Output delimiter: {snap.get('output_format.delimiter')}")
+    _say(f"   Clean data: {snap.get('processing.clean_data')}")
     
     # Example 2: Custom configuration
-    print("\n🔧 Custom Configuration:")
+    _say("\n🔧 Custom Configuration:")
     custom_settings = {
         'extraction_method': 'camelot',
         'output_format': {
@@ -279,32 +432,32 @@ def configuration_examples():
     
     custom_config = ConfigManager()
     custom_config.update_settings(custom_settings)
-    
-    print(f"   Extraction method: {custom_config.get('extraction_method')}")
-    print(f"   Output delimiter: {custom_config.get('output_format.delimiter')}")
-    print(f"   Clean data: {custom_config.get('processing.clean_data')}")
+
+    snap = custom_config.snapshot()
+    _say(f"   Extraction method: {snap.get('extraction_method')}")
+    _say(f"   Output delimiter: {snap.get('output_format.delimiter')}")
+    _say(f"   Clean data: {snap.get('processing.clean_data')}")
     
     # Save custom configuration
     custom_config.save_config("examples/custom_config.json")
-    print("   ✅ Custom configuration saved to examples/custom_config.json")
+    _say("   ✅ Custom configuration saved to examples/custom_config.json")
     
     # Validate configuration
     validation = custom_config.validate_config()
-    print(f"   Configuration valid: {validation['valid']}")
+    _say(f"   Configuration valid: {validation['valid']}")
     if validation['errors']:
-        print(f"   Errors: {validation['errors']}")
+        _say(f"   Errors: {validation['errors']}")
     if validation['warnings']:
-        print(f"   Warnings: {validation['warnings']}")
+        _say(f"   Warnings: {validation['warnings']}")
 
 def file_info_example():
     """Example 6: Getting file information"""
-    print("="*60)
-    print("Example 6: File Information and Validation")
-    print("="*60)
-    
-    file_handler = FileHandler()
-    extractor = PDFExtractor()
+    _say("="*60)
+    _say("Example 6: File Information and Validation")
+    _say("="*60)
     
+    config, extractor, converter, file_handler = _get_components()
+
     # Example files to check
     example_files = [
         "sample_data.pdf",
@@ -313,56 +466,71 @@ def file_info_example():
     ]
     
     for pdf_path in example_files:
-        print(f"\n📄 Checking file: {pdf_path}")
+        _say(f"\n📄 Checking file: {pdf_path}")
         
-        # Get file info
-        file_info = file_handler.get_file_info(pdf_path)
+        # Get file info (skip hashing - this is just a listing)
+        file_info = file_handler.get_file_info(pdf_path, include_hash=False)
         
         if file_info:
-            print(f"   ✅ File exists")
-            print(f"   Size: {file_info.get('size_human', 'Unknown')}")
-            print(f"   Extension: {file_info.get('extension', 'Unknown')}")
-            print(f"   MIME type: {file_info.get('mime_type', 'Unknown')}")
-            print(f"   Readable: {file_info.get('is_readable', False)}")
-            
-            # Validate as PDF
-            is_valid = file_handler.validate_pdf(pdf_path)
-            print(f"   Valid PDF: {is_valid}")
+            _say(f"   ✅ File exists")
+            _say(f"   Size: {file_info.get('size_human', 'Unknown')}")
+            _say(f"   Extension: {file_info.get('extension', 'Unknown')}")
+            _say(f"   MIME type: {file_info.get('mime_type', 'Unknown')}")
+            _say(f"   Readable: {file_info.get('is_readable', False)}")
             
-            if is_valid:
-                # Get PDF-specific info
-                pdf_info = extractor.get_pdf_info(pdf_path)
-                if pdf_info:
-                    print(f"   Pages: {pdf_info.get('total_pages', 'Unknown')}")
-                    print(f"   Metadata: {bool(pdf_info.get('metadata'))}")
+            # Open once and reuse the parsed reader for validation + info
+            try:
+                with open(pdf_path, 'rb', buffering=1 << 20) as fh:
+                    reader = PyPDF2.PdfReader(fh, strict=False)
+
+                    is_valid = extractor.validate_pdf(reader)
+                    _say(f"   Valid PDF: {is_valid}")
+
+                    if is_valid:
+                        # Metadata fast path, no page content
+                        pdf_info = extractor.get_pdf_info(reader, metadata_only=True)
+                        if pdf_info:
+                            _say(f"   Pages: {pdf_info.get('total_pages', 'Unknown')}")
+                            _say(f"   Metadata: {bool(pdf_info.get('metadata'))}")
+            except Exception:
+                _say(f"   Valid PDF: False")
         else:
-            print(f"   ❌ File not found or inaccessible")
+            _say(f"   ❌ File not found or inaccessible")
 
 def main():
     """Run all examples"""
-    print("🚀 PDF to CSV Processor - Basic Usage Examples")
-    print("=" * 60)
+    _say("🚀 PDF to CSV Processor - Basic Usage Examples")
+    _say("=" * 60)
     
     logger = setup_logger(__name__)
     logger.info("Starting basic usage examples")
     
+    examples = [
+        basic_pdf_to_csv_conversion,
+        advanced_extraction_with_options,
+        batch_processing_example,
+        preview_extraction_example,
+        configuration_examples,
+        file_info_example
+    ]
+
+    executor = ThreadPoolExecutor(max_workers=len(examples))
     try:
-        # Run examples
-        basic_pdf_to_csv_conversion()
-        advanced_extraction_with_options()
-        batch_processing_example()
-        preview_extraction_example()
-        configuration_examples()
-        file_info_example()
-        
-        print("\n🎉 All examples completed!")
-        print("\nNote: Some examples may show errors if sample PDF files are not present.")
-        print("This is expected behavior for demonstration purposes.")
+        # The examples touch distinct files and share only the cached
+        # components, so their I/O waits can overlap
+        list(executor.map(lambda example: example(), examples))
+        executor.shutdown()
+
+        _say("\n🎉 All examples completed!")
+        _say("\nNote: Some examples may show errors if sample PDF files are not present.")
+        _say("This is expected behavior for demonstration purposes.")
         
     except KeyboardInterrupt:
-        print("\n🛑 Examples interrupted by user")
+        executor.shutdown(wait=False, cancel_futures=True)
+        _say("\n🛑 Examples interrupted by user")
     except Exception as e:
-        print(f"\n❌ Examples failed: {str(e)}")
+        executor.shutdown(wait=False, cancel_futures=True)
+        _say(f"\n❌ Examples failed: {str(e)}")
         logger.error(f"Examples failed: {str(e)}")
 
 if __name__ == "__main__":
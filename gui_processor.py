@@ -12,8 +12,16 @@ Version: 1.0.0
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
+import numpy as np
+import hashlib
+import json
+import re
+import shutil
 import threading
 import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
@@ -24,8 +32,130 @@ from src.utils.file_handler import FileHandler
 from src.utils.logger import setup_logger
 
 
+# Directory for content-hash cached conversion results
+_CACHE_DIR = Path(".cache")
+
+# Page specs like "1-3,5,7-9" are parsed once in the GUI layer so the
+# extractor receives explicit page numbers instead of re-parsing the
+# string for every file in a batch
+_PAGES_RE = re.compile(r'(\d+)(?:-(\d+))?')
+
+
+def _parse_pages(spec):
+    """Parse a page spec string into a sorted tuple of page numbers
+
+    Returns None for an empty spec. Open-ended specs like "2-end" are
+    returned unchanged - the extractor resolves those against the
+    actual page count.
+    """
+    if not spec:
+        return None
+    if 'end' in spec:
+        return spec
+    pages = set()
+    for match in _PAGES_RE.finditer(spec):
+        start = int(match.group(1))
+        end = int(match.group(2) or start)
+        pages.update(range(start, end + 1))
+    return tuple(sorted(pages)) or None
+
+
+# Per-process components, built once by the pool initializer so each
+# worker pays backend startup a single time instead of once per file
+_WORKER_EXTRACTOR = None
+_WORKER_CONVERTER = None
+
+
+def _init_worker(config_path=None):
+    """Initialize the shared extractor/converter pair in a pool worker"""
+    global _WORKER_EXTRACTOR, _WORKER_CONVERTER
+    config = ConfigManager(config_path)
+    _WORKER_EXTRACTOR = PDFExtractor(config)
+    _WORKER_CONVERTER = CSVConverter(config)
+
+
+def _compute_file_hash(path):
+    """SHA-256 of a file, read in 64 KB chunks"""
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def _options_hash(options):
+    """Stable short hash of a processing options dict"""
+    payload = json.dumps(options, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def _cache_path(input_path, options):
+    """Cache file location for a given input + options combination"""
+    return _CACHE_DIR / f"{_compute_file_hash(input_path)}_{_options_hash(options)}.csv"
+
+
+def _worker_process_file(input_path, output_path, options, use_cache=False):
+    """
+    Process one PDF in a worker process (must stay module-level so it
+    is picklable for ProcessPoolExecutor)
+
+    Args:
+        input_path: Path to the input PDF
+        output_path: Path for the output CSV
+        options: Processing options dict
+        use_cache: Reuse content-hash cached results when available
+
+    Returns:
+        Tuple of (input_path, success, error_message)
+    """
+    try:
+        # Cache hit: same bytes + same options means same CSV
+        cache_file = None
+        if use_cache:
+            cache_file = _cache_path(input_path, options)
+            if cache_file.exists():
+                shutil.copy(cache_file, output_path)
+                return (input_path, True, None)
+
+        # Reuse the per-process components (built on demand when the
+        # pool was created without the initializer)
+        if _WORKER_EXTRACTOR is None:
+            _init_worker()
+        extractor = _WORKER_EXTRACTOR
+        converter = _WORKER_CONVERTER
+
+        extracted_data = extractor.extract_data(input_path, **options)
+
+        if not extracted_data or not (extracted_data.get('tables')
+                                      or extracted_data.get('tables_path')):
+            return (input_path, False, "No data extracted")
+
+        # Stream rows straight to disk instead of building the full CSV
+        # string in memory first
+        with open(output_path, 'wb', buffering=1 << 20) as f:
+            rows_written = converter.write_csv(extracted_data, f, **options)
+
+        if rows_written:
+            # Populate the cache for next time
+            if cache_file is not None:
+                _CACHE_DIR.mkdir(exist_ok=True)
+                shutil.copy(output_path, cache_file)
+            return (input_path, True, None)
+        return (input_path, False, "Failed to save CSV")
+
+    except Exception as e:
+        return (input_path, False, str(e))
+
+
 class PDFProcessorGUI:
     """GUI Application for PDF to CSV processing"""
+
+    # Cap on lines kept in the processing log widget; oldest lines are
+    # dropped past this so huge batches can't blow up Tk's text B-tree
+    MAX_LOG_LINES = 5000
+
+    # Entries kept in the preview-to-process extraction cache
+    PREVIEW_CACHE_SIZE = 8
     
     def __init__(self, root):
         self.root = root
@@ -33,13 +163,12 @@ class PDFProcessorGUI:
         self.root.geometry("800x600")
         self.root.minsize(600, 400)
         
-        # Initialize components
+        # Initialize components (extractor/converter/file_handler are
+        # cached properties - heavy backends load on first real use,
+        # not at startup)
         self.config = ConfigManager()
-        self.extractor = PDFExtractor(self.config)
-        self.converter = CSVConverter(self.config)
-        self.file_handler = FileHandler()
         self.logger = setup_logger(__name__)
-        
+
         # Variables
         self.input_file_var = tk.StringVar()
         self.output_file_var = tk.StringVar()
@@ -50,40 +179,126 @@ class PDFProcessorGUI:
         self.pages_var = tk.StringVar()
         self.delimiter_var = tk.StringVar(value=",")
         self.encoding_var = tk.StringVar(value="utf-8")
-        
+
+        # Progress/status variables (created here, not in the tab
+        # builders, because tabs are now built lazily)
+        self.progress_var = tk.DoubleVar()
+        self.status_var = tk.StringVar(value="Ready")
+        self.batch_progress_var = tk.DoubleVar()
+        self.batch_status_var = tk.StringVar(value="Ready for batch processing")
+
+        # Settings variables
+        self.clean_data_var = tk.BooleanVar(value=True)
+        self.merge_cells_var = tk.BooleanVar(value=True)
+        self.skip_empty_var = tk.BooleanVar(value=True)
+        self.header_row_var = tk.BooleanVar(value=True)
+        self.ocr_enabled_var = tk.BooleanVar(value=False)
+        self.cache_enabled_var = tk.BooleanVar(value=False)
+        self.verbose_logging_var = tk.BooleanVar(value=False)
+        self.show_dialogs_var = tk.BooleanVar(value=True)
+
         # Processing state
         self.processing = False
+        self._file_sizes = {}
+        self._config_path = None
+
+        # Extraction results from preview, keyed by (content hash,
+        # options hash) so an unchanged file processed right after a
+        # preview skips the second extraction (small LRU, OCR pages
+        # are expensive to re-render)
+        self._preview_cache = OrderedDict()
+
+        # Persistent pool for single-file jobs: extraction is CPU-bound,
+        # so running it in a subprocess keeps the GIL free for the Tk
+        # mainloop (batch jobs spin up their own sized pool)
+        self._pool = ProcessPoolExecutor(max_workers=max(1, (os.cpu_count() or 2) // 2),
+                                         initializer=_init_worker,
+                                         initargs=(self._config_path,))
+
+        # Log buffer: messages are queued and flushed in batches so the
+        # text widget isn't redrawn for every processed file
+        self._log_buffer = []
+        self._log_flush_scheduled = False
         
         # Setup GUI
         self.create_widgets()
         self.center_window()
-    
+
+        # Options cache: reading a Tk variable crosses the Tcl boundary,
+        # so snapshot all of them once and invalidate on any change
+        self._options_cache = None
+        for var in (self.processing_method_var, self.data_pattern_var,
+                    self.pages_var, self.delimiter_var, self.encoding_var,
+                    self.clean_data_var, self.merge_cells_var,
+                    self.skip_empty_var, self.header_row_var,
+                    self.ocr_enabled_var, self.verbose_logging_var):
+            var.trace_add('write', self._invalidate_options)
+
+        # Coalesced progress: workers write plain attributes and a 100 ms
+        # tick pushes them into the Tk variables, so fast batches don't
+        # trigger a Tcl event and redraw per file
+        self._progress_state = 0.0
+        self._status_state = None
+        self._batch_progress_state = 0.0
+        self._batch_status_state = None
+        self._ui_pushed = {}
+        self._ui_tick_running = True
+        self.root.after(100, self._tick_ui)
+
+    @cached_property
+    def extractor(self):
+        """PDF extractor, created on first real use"""
+        return PDFExtractor(self.config)
+
+    @cached_property
+    def converter(self):
+        """CSV converter, created on first real use"""
+        return CSVConverter(self.config)
+
+    @cached_property
+    def file_handler(self):
+        """File handler, created on first real use"""
+        return FileHandler()
+
     def create_widgets(self):
-        """Create and arrange GUI widgets"""
-        
+        """Create and arrange GUI widgets
+
+        Only the first tab is built up front; the others start as empty
+        placeholder frames and are filled in on first visit, so startup
+        doesn't pay for widgets the user may never open.
+        """
+
         # Create notebook for tabs
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Single file processing tab
+
+        # Single file processing tab (shown first, built eagerly)
         self.single_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.single_frame, text="Single File")
         self.create_single_file_tab()
-        
-        # Batch processing tab
+
+        # Remaining tabs are placeholders until first shown
         self.batch_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.batch_frame, text="Batch Processing")
-        self.create_batch_processing_tab()
-        
-        # Settings tab
+
         self.settings_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.settings_frame, text="Settings")
-        self.create_settings_tab()
-        
-        # Log tab
+
         self.log_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.log_frame, text="Processing Log")
-        self.create_log_tab()
+
+        self._tab_builders = {
+            str(self.batch_frame): self.create_batch_processing_tab,
+            str(self.settings_frame): self.create_settings_tab,
+            str(self.log_frame): self.create_log_tab,
+        }
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+    def _on_tab_changed(self, event):
+        """Build a lazily-created tab the first time it is shown"""
+        builder = self._tab_builders.pop(self.notebook.select(), None)
+        if builder is not None:
+            builder()
     
     def create_single_file_tab(self):
         """Create single file processing interface"""
@@ -140,12 +355,10 @@ class PDFProcessorGUI:
         ttk.Button(button_frame, text="🗑️ Clear", command=self.clear_single_form).pack(side=tk.LEFT, padx=(10, 0))
         
         # Progress bar
-        self.progress_var = tk.DoubleVar()
         self.progress_bar = ttk.Progressbar(main_frame, variable=self.progress_var, mode='determinate')
         self.progress_bar.pack(fill=tk.X, pady=(10, 0))
-        
+
         # Status label
-        self.status_var = tk.StringVar(value="Ready")
         self.status_label = ttk.Label(main_frame, textvariable=self.status_var)
         self.status_label.pack(pady=(5, 0))
     
@@ -183,11 +396,11 @@ class PDFProcessorGUI:
         self.file_tree.column("status", width=100)
         
         # Scrollbar for treeview
-        tree_scroll = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.file_tree.yview)
-        self.file_tree.configure(yscrollcommand=tree_scroll.set)
-        
+        self.tree_scroll = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.file_tree.yview)
+        self.file_tree.configure(yscrollcommand=self.tree_scroll.set)
+
         self.file_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        tree_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree_scroll.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Batch action buttons
         batch_button_frame = ttk.Frame(main_frame)
@@ -199,11 +412,9 @@ class PDFProcessorGUI:
         ttk.Button(batch_button_frame, text="🗑️ Clear List", command=self.clear_file_list).pack(side=tk.LEFT, padx=(10, 0))
         
         # Batch progress
-        self.batch_progress_var = tk.DoubleVar()
         self.batch_progress_bar = ttk.Progressbar(main_frame, variable=self.batch_progress_var, mode='determinate')
         self.batch_progress_bar.pack(fill=tk.X, pady=(10, 0))
-        
-        self.batch_status_var = tk.StringVar(value="Ready for batch processing")
+
         self.batch_status_label = ttk.Label(main_frame, textvariable=self.batch_status_var)
         self.batch_status_label.pack(pady=(5, 0))
     
@@ -232,27 +443,19 @@ class PDFProcessorGUI:
         process_settings.pack(fill=tk.X, pady=(0, 10))
         
         # Checkboxes for various options
-        self.clean_data_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(process_settings, text="Clean extracted data", variable=self.clean_data_var).pack(anchor=tk.W)
-        
-        self.merge_cells_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(process_settings, text="Merge split cells", variable=self.merge_cells_var).pack(anchor=tk.W)
-        
-        self.skip_empty_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(process_settings, text="Skip empty rows", variable=self.skip_empty_var).pack(anchor=tk.W)
-        
-        self.header_row_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(process_settings, text="Include header row", variable=self.header_row_var).pack(anchor=tk.W)
         
         # Advanced settings
         advanced_settings = ttk.LabelFrame(main_frame, text="Advanced Settings", padding=10)
         advanced_settings.pack(fill=tk.X, pady=(0, 10))
         
-        self.ocr_enabled_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(advanced_settings, text="Enable OCR for scanned PDFs", variable=self.ocr_enabled_var).pack(anchor=tk.W)
-        
-        self.verbose_logging_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(advanced_settings, text="Cache results by content hash", variable=self.cache_enabled_var).pack(anchor=tk.W)
         ttk.Checkbutton(advanced_settings, text="Enable verbose logging", variable=self.verbose_logging_var).pack(anchor=tk.W)
+        ttk.Checkbutton(advanced_settings, text="Show completion dialogs", variable=self.show_dialogs_var).pack(anchor=tk.W)
         
         # Settings buttons
         settings_buttons = ttk.Frame(main_frame)
@@ -279,6 +482,9 @@ class PDFProcessorGUI:
         ttk.Button(log_controls, text="🗑️ Clear Log", command=self.clear_log).pack(side=tk.LEFT)
         ttk.Button(log_controls, text="💾 Save Log", command=self.save_log).pack(side=tk.LEFT, padx=(10, 0))
         ttk.Button(log_controls, text="🔄 Refresh", command=self.refresh_log).pack(side=tk.LEFT, padx=(10, 0))
+
+        # Show anything logged before the tab was first opened
+        self._flush_log()
     
     # File selection methods
     def browse_input_file(self):
@@ -341,50 +547,60 @@ class PDFProcessorGUI:
         thread.start()
     
     def _process_single_thread(self, input_file, output_file):
-        """Process single file in separate thread"""
+        """Run a single-file job on the process pool and report the result
+
+        The actual extract/convert happens in a subprocess (it is
+        CPU-bound, so a plain thread would fight the mainloop for the
+        GIL); this thread only waits on the future and marshals the
+        UI updates back through root.after.
+        """
         try:
-            self.status_var.set("Processing PDF...")
-            self.progress_var.set(0)
-            
-            # Get processing options
+            self._status_state = "Processing PDF..."
+            self._progress_state = 25
+
             options = self._get_processing_options()
-            
-            # Extract data
-            self.progress_var.set(25)
-            self.status_var.set("Extracting data...")
-            extracted_data = self.extractor.extract_data(input_file, **options)
-            
-            if not extracted_data:
-                self.log_message("❌ No data extracted from PDF")
-                messagebox.showerror("Error", "No data could be extracted from the PDF")
-                return
-            
-            # Convert to CSV
-            self.progress_var.set(50)
-            self.status_var.set("Converting to CSV...")
-            csv_data = self.converter.convert_to_csv(extracted_data, **options)
-            
-            # Save file
-            self.progress_var.set(75)
-            self.status_var.set("Saving CSV file...")
-            success = self.file_handler.save_csv(csv_data, output_file)
-            
-            self.progress_var.set(100)
-            
-            if success:
-                self.status_var.set("✅ Processing completed successfully!")
-                self.log_message(f"✅ Successfully processed: {Path(input_file).name}")
-                self.log_message(f"📁 Output saved to: {output_file}")
-                messagebox.showinfo("Success", f"PDF processed successfully!\n\nOutput: {output_file}")
+            use_cache = self.cache_enabled_var.get()
+
+            # A preview of the same unchanged file already did the
+            # extraction - just write the CSV from the cached result
+            cache_key = (_compute_file_hash(input_file), _options_hash(options))
+            cached = self._preview_cache.get(cache_key)
+            if cached is not None:
+                self._preview_cache.move_to_end(cache_key)
+                self._status_state = "Writing CSV from preview..."
+                with open(output_file, 'wb', buffering=1 << 20) as f:
+                    rows_written = self.converter.write_csv(cached, f, **options)
+                success = rows_written > 0
+                error = None if success else "Failed to save CSV"
             else:
-                self.status_var.set("❌ Failed to save CSV file")
-                self.log_message("❌ Failed to save CSV file")
-                messagebox.showerror("Error", "Failed to save CSV file")
-        
+                future = self._pool.submit(_worker_process_file, input_file,
+                                           output_file, options, use_cache)
+                _, success, error = future.result()
+
+            self._progress_state = 100
+
+            def _report():
+                if success:
+                    self._status_state = "✅ Processing completed successfully!"
+                    self.log_message(f"✅ Successfully processed: {Path(input_file).name}")
+                    self.log_message(f"📁 Output saved to: {output_file}")
+                    self._maybe_notify("Success", f"PDF processed successfully!\n\nOutput: {output_file}")
+                elif error == "No data extracted":
+                    self._status_state = "❌ No data extracted"
+                    self.log_message("❌ No data extracted from PDF")
+                    self._maybe_notify("Error", "No data could be extracted from the PDF", error=True)
+                else:
+                    self._status_state = "❌ Processing failed"
+                    self.log_message(f"❌ Error: {error}")
+                    self._maybe_notify("Error", f"Processing failed:\n\n{error}", error=True)
+
+            self.root.after(0, _report)
+
         except Exception as e:
             self.log_message(f"❌ Error: {str(e)}")
-            messagebox.showerror("Error", f"Processing failed:\n\n{str(e)}")
-        
+            self.root.after(0, self._maybe_notify, "Error",
+                            f"Processing failed:\n\n{str(e)}", True)
+
         finally:
             self.processing = False
             self.process_button.config(state=tk.NORMAL)
@@ -411,11 +627,19 @@ class PDFProcessorGUI:
         
         try:
             options = self._get_processing_options()
+            cache_key = (_compute_file_hash(input_file), _options_hash(options))
             options['preview_only'] = True
-            
+
             extracted_data = self.extractor.extract_data(input_file, **options)
-            
+
             if extracted_data:
+                # Remember the extraction so processing the same file
+                # right after the preview doesn't extract twice
+                self._preview_cache[cache_key] = extracted_data
+                self._preview_cache.move_to_end(cache_key)
+                while len(self._preview_cache) > self.PREVIEW_CACHE_SIZE:
+                    self._preview_cache.popitem(last=False)
+
                 preview_text.insert(tk.END, f"PDF File: {Path(input_file).name}\n")
                 preview_text.insert(tk.END, f"Pages: {extracted_data.get('pages', 'All')}\n")
                 preview_text.insert(tk.END, f"Tables Found: {len(extracted_data.get('tables', []))}\n")
@@ -446,21 +670,42 @@ class PDFProcessorGUI:
         
         # Clear existing items
         self.clear_file_list()
-        
-        # Find PDF files
-        pdf_files = list(Path(input_dir).glob("*.pdf"))
-        
-        for pdf_file in pdf_files:
-            # Get file size
-            size = pdf_file.stat().st_size
-            size_str = f"{size / 1024:.1f} KB" if size < 1024*1024 else f"{size / (1024*1024):.1f} MB"
-            
-            # Add to tree
-            self.file_tree.insert("", tk.END, text=pdf_file.name, values=(size_str, "Ready"))
-        
-        self.batch_status_var.set(f"Found {len(pdf_files)} PDF files")
+        self._file_sizes = {}
+        
+        # Find PDF files with os.scandir - the DirEntry stat is cached
+        # from the directory read, so this is one syscall per file
+        # instead of readdir + stat
+        with os.scandir(input_dir) as entries:
+            pdf_entries = [(entry.name, entry.stat().st_size)
+                           for entry in entries
+                           if entry.is_file() and entry.name.lower().endswith('.pdf')]
+
+        # Compute the size columns vectorized over all entries at once
+        # instead of branching and dividing inside the insert loop
+        sizes = np.fromiter((size for _, size in pdf_entries), dtype=np.int64,
+                            count=len(pdf_entries))
+        kb = sizes / 1024.0
+        mb = kb / 1024.0
+        is_mb = sizes >= 1 << 20
+        size_strs = [f"{m:.1f} MB" if big else f"{k:.1f} KB"
+                     for k, m, big in zip(kb, mb, is_mb)]
+
+        # Detach the treeview during the bulk insert so Tk doesn't
+        # redraw once per row, then reattach in its original slot
+        self.file_tree.pack_forget()
+        try:
+            for (name, size), size_str in zip(pdf_entries, size_strs):
+                self._file_sizes[name] = size
+
+                # Add to tree
+                self.file_tree.insert("", tk.END, text=name, values=(size_str, "Ready"))
+        finally:
+            self.file_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True,
+                                before=self.tree_scroll)
+
+        self.batch_status_var.set(f"Found {len(pdf_entries)} PDF files")
         self.log_message(f"📁 Scanned directory: {input_dir}")
-        self.log_message(f"📄 Found {len(pdf_files)} PDF files")
+        self.log_message(f"📄 Found {len(pdf_entries)} PDF files")
     
     def process_batch(self):
         """Process all files in batch mode"""
@@ -474,12 +719,22 @@ class PDFProcessorGUI:
             messagebox.showerror("Error", "Please select both input and output directories")
             return
         
-        # Get list of files from tree
+        # Get list of files from tree, with the sizes cached at scan time
         files_to_process = []
         for item in self.file_tree.get_children():
             filename = self.file_tree.item(item, "text")
-            files_to_process.append((item, filename))
-        
+            size = self._file_sizes.get(filename)
+            if size is None:
+                try:
+                    size = os.path.getsize(Path(input_dir) / filename)
+                except OSError:
+                    size = 0
+            files_to_process.append((item, filename, size))
+
+        # Largest first: LPT scheduling keeps pool workers from idling
+        # at the tail while one big PDF finishes last
+        files_to_process.sort(key=lambda t: t[2], reverse=True)
+
         if not files_to_process:
             messagebox.showerror("Error", "No files to process. Please scan the directory first.")
             return
@@ -492,82 +747,149 @@ class PDFProcessorGUI:
         thread.start()
     
     def _process_batch_thread(self, input_dir, output_dir, files_to_process):
-        """Process batch files in separate thread"""
-        
+        """Dispatch batch files to a process pool and collect results"""
+
         # Create output directory
         Path(output_dir).mkdir(parents=True, exist_ok=True)
-        
+
         total_files = len(files_to_process)
         processed = 0
         success_count = 0
-        
+
         options = self._get_processing_options()
-        
-        for item_id, filename in files_to_process:
-            try:
-                self.batch_status_var.set(f"Processing {filename}...")
-                self.file_tree.set(item_id, "status", "Processing...")
-                
-                # Update progress
+        use_cache = self.cache_enabled_var.get()
+        if use_cache:
+            _CACHE_DIR.mkdir(exist_ok=True)
+
+        # Extraction is CPU-bound, so spread files across processes
+        num_workers = min(os.cpu_count() or 1, total_files)
+
+        input_parent = Path(input_dir)
+        output_parent = Path(output_dir)
+
+        with ProcessPoolExecutor(max_workers=num_workers,
+                                 initializer=_init_worker,
+                                 initargs=(self._config_path,)) as executor:
+            futures = {}
+            for item_id, filename, _size in files_to_process:
+                input_path = str(input_parent / filename)
+                output_path = str(output_parent / (Path(filename).stem + ".csv"))
+
+                self.root.after(0, self.file_tree.set, item_id, "status", "Queued")
+                future = executor.submit(_worker_process_file, input_path, output_path,
+                                         options, use_cache)
+                futures[future] = (item_id, filename)
+
+            for future in as_completed(futures):
+                item_id, filename = futures[future]
+                _, success, error = future.result()
+                processed += 1
                 progress = (processed / total_files) * 100
-                self.batch_progress_var.set(progress)
-                
-                # Process file
-                input_path = Path(input_dir) / filename
-                output_path = Path(output_dir) / (Path(filename).stem + ".csv")
-                
-                extracted_data = self.extractor.extract_data(str(input_path), **options)
-                
-                if extracted_data:
-                    csv_data = self.converter.convert_to_csv(extracted_data, **options)
-                    success = self.file_handler.save_csv(csv_data, str(output_path))
-                    
-                    if success:
-                        self.file_tree.set(item_id, "status", "✅ Success")
-                        success_count += 1
-                        self.log_message(f"✅ Processed: {filename}")
-                    else:
-                        self.file_tree.set(item_id, "status", "❌ Save Failed")
-                        self.log_message(f"❌ Failed to save: {filename}")
+
+                if success:
+                    success_count += 1
+                    self._update_batch_item(item_id, "✅ Success",
+                                            f"✅ Processed: {filename}", progress)
+                elif error == "No data extracted":
+                    self._update_batch_item(item_id, "❌ No Data",
+                                            f"❌ No data extracted: {filename}", progress)
                 else:
-                    self.file_tree.set(item_id, "status", "❌ No Data")
-                    self.log_message(f"❌ No data extracted: {filename}")
-            
-            except Exception as e:
-                self.file_tree.set(item_id, "status", "❌ Error")
-                self.log_message(f"❌ Error processing {filename}: {str(e)}")
-            
-            processed += 1
-        
-        # Batch complete
-        self.batch_progress_var.set(100)
-        self.batch_status_var.set(f"Batch complete: {success_count}/{total_files} files processed successfully")
-        
-        messagebox.showinfo("Batch Complete", 
-                           f"Batch processing completed!\n\n"
-                           f"Total files: {total_files}\n"
-                           f"Successful: {success_count}\n"
-                           f"Failed: {total_files - success_count}")
-        
+                    self._update_batch_item(item_id, "❌ Error",
+                                            f"❌ Error processing {filename}: {error}", progress)
+
+        # Batch complete - marshal the final UI updates to the main thread
+        self._batch_progress_state = 100
+        self._batch_status_state = (
+            f"Batch complete: {success_count}/{total_files} files processed successfully")
+
+        def _finish():
+            self._maybe_notify("Batch Complete",
+                               f"Batch processing completed!\n\n"
+                               f"Total files: {total_files}\n"
+                               f"Successful: {success_count}\n"
+                               f"Failed: {total_files - success_count}")
+
+        self.root.after(0, _finish)
+
         self.processing = False
         self.batch_process_button.config(state=tk.NORMAL)
+
+    def _update_batch_item(self, item_id, status, log_line, progress):
+        """Push one batch result into the UI from the collector thread
+
+        Progress and status go through the coalesced tick state; only
+        the per-row tree update and log line are marshalled directly.
+        """
+        self._batch_progress_state = progress
+        self._batch_status_state = log_line
+
+        def _apply():
+            self.file_tree.set(item_id, "status", status)
+            self.log_message(log_line)
+
+        self.root.after(0, _apply)
     
+    def _maybe_notify(self, title, message, error=False):
+        """Show a completion dialog, or just log it when dialogs are off
+
+        Modal dialogs block until dismissed; with "Show completion
+        dialogs" unchecked a batch run finishes completely hands-off.
+        """
+        if self.show_dialogs_var.get():
+            if error:
+                messagebox.showerror(title, message)
+            else:
+                messagebox.showinfo(title, message)
+        else:
+            self.log_message(f"🔔 {title}: {message.splitlines()[0]}")
+
+    def _tick_ui(self):
+        """Push coalesced worker progress/status into the Tk variables
+
+        Runs every 100 ms on the mainloop; only touches a Tk variable
+        when the corresponding state attribute actually changed since
+        the last push, so idle ticks cost nothing.
+        """
+        if not self._ui_tick_running:
+            return
+
+        updates = (
+            (self.progress_var, self._progress_state),
+            (self.status_var, self._status_state),
+            (self.batch_progress_var, self._batch_progress_state),
+            (self.batch_status_var, self._batch_status_state),
+        )
+        for var, state in updates:
+            if state is not None and self._ui_pushed.get(id(var)) != state:
+                var.set(state)
+                self._ui_pushed[id(var)] = state
+
+        self.root.after(100, self._tick_ui)
+
     # Utility methods
+    def _invalidate_options(self, *args):
+        """Drop the cached options snapshot when any setting changes"""
+        self._options_cache = None
+
     def _get_processing_options(self):
-        """Get current processing options from GUI"""
-        return {
-            'method': self.processing_method_var.get(),
-            'pattern': self.data_pattern_var.get(),
-            'pages': self.pages_var.get() if self.pages_var.get() else None,
-            'delimiter': self.delimiter_var.get(),
-            'encoding': self.encoding_var.get(),
-            'clean_data': self.clean_data_var.get(),
-            'merge_cells': self.merge_cells_var.get(),
-            'skip_empty': self.skip_empty_var.get(),
-            'header_row': self.header_row_var.get(),
-            'ocr_enabled': self.ocr_enabled_var.get(),
-            'verbose': self.verbose_logging_var.get()
-        }
+        """Get current processing options from GUI (cached until a setting changes)"""
+        if self._options_cache is None:
+            self._options_cache = {
+                'method': self.processing_method_var.get(),
+                'pattern': self.data_pattern_var.get(),
+                'pages': _parse_pages(self.pages_var.get()),
+                'delimiter': self.delimiter_var.get(),
+                'encoding': self.encoding_var.get(),
+                'clean_data': self.clean_data_var.get(),
+                'merge_cells': self.merge_cells_var.get(),
+                'skip_empty': self.skip_empty_var.get(),
+                'header_row': self.header_row_var.get(),
+                'ocr_enabled': self.ocr_enabled_var.get(),
+                'verbose': self.verbose_logging_var.get()
+            }
+
+        # Copy so callers can mutate/pickle their snapshot freely
+        return dict(self._options_cache)
     
     def clear_single_form(self):
         """Clear single file form"""
@@ -585,25 +907,52 @@ class PDFProcessorGUI:
         self.batch_status_var.set("Ready for batch processing")
     
     def log_message(self, message):
-        """Add message to processing log"""
-        self.log_text.insert(tk.END, f"{message}\n")
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+        """Queue a message for the processing log (flushed in batches)"""
+        self._log_buffer.append(message)
+
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.root.after(100, self._flush_log)
+
+    def _flush_log(self):
+        """Append all queued log messages in a single text insert"""
+        self._log_flush_scheduled = False
+
+        # Log tab not built yet: keep buffering, create_log_tab flushes
+        if 'log_text' not in self.__dict__:
+            return
+
+        if self._log_buffer:
+            self.log_text.insert(tk.END, "\n".join(self._log_buffer) + "\n")
+            self._log_buffer.clear()
+
+            # Rotate: drop the oldest lines once past the cap
+            lines = int(self.log_text.index('end-1c').split('.')[0])
+            if lines > self.MAX_LOG_LINES:
+                self.log_text.delete('1.0', f'{lines - self.MAX_LOG_LINES}.0')
+
+            self.log_text.see(tk.END)
     
     def clear_log(self):
         """Clear processing log"""
+        self._log_buffer.clear()
         self.log_text.delete(1.0, tk.END)
-    
+
     def save_log(self):
         """Save processing log to file"""
+        self._flush_log()
         filename = filedialog.asksaveasfilename(
             title="Save Processing Log",
             defaultextension=".txt",
             filetypes=[("Text Files", "*.txt"), ("All Files", "*.*")]
         )
         if filename:
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(self.log_text.get(1.0, tk.END))
+            # Pull the widget contents in 1000-line chunks through a
+            # 1 MiB buffer instead of one giant Tcl-to-Python string
+            total_lines = int(self.log_text.index('end-1c').split('.')[0])
+            with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                for start in range(1, total_lines + 1, 1000):
+                    f.write(self.log_text.get(f'{start}.0', f'{start + 1000}.0'))
             messagebox.showinfo("Success", f"Log saved to {filename}")
     
     def refresh_log(self):
@@ -644,10 +993,26 @@ class PDFProcessorGUI:
         self.skip_empty_var.set(True)
         self.header_row_var.set(True)
         self.ocr_enabled_var.set(False)
+        self.cache_enabled_var.set(False)
         self.verbose_logging_var.set(False)
+        self.show_dialogs_var.set(True)
         
         messagebox.showinfo("Success", "Settings reset to defaults")
     
+    def _restart_pool(self):
+        """
+        Recreate the single-file pool with the current config path
+
+        Pool workers build their extractor/converter from the config
+        the initializer saw, so a configuration loaded afterwards would
+        be silently ignored until the pool is recycled. In-flight jobs
+        run to completion on the old pool.
+        """
+        self._pool.shutdown(wait=False)
+        self._pool = ProcessPoolExecutor(max_workers=max(1, (os.cpu_count() or 2) // 2),
+                                         initializer=_init_worker,
+                                         initargs=(self._config_path,))
+
     def load_config(self):
         """Load settings from config file"""
         filename = filedialog.askopenfilename(
@@ -657,6 +1022,8 @@ class PDFProcessorGUI:
         if filename:
             try:
                 self.config.load_config(filename)
+                self._config_path = filename
+                self._restart_pool()
                 messagebox.showinfo("Success", f"Configuration loaded from {filename}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load configuration: {str(e)}")
@@ -687,10 +1054,11 @@ def main():
     # Handle window closing
     def on_closing():
         if app.processing:
-            if messagebox.askokcancel("Quit", "Processing is in progress. Do you want to quit anyway?"):
-                root.destroy()
-        else:
-            root.destroy()
+            if not messagebox.askokcancel("Quit", "Processing is in progress. Do you want to quit anyway?"):
+                return
+        app._ui_tick_running = False
+        app._pool.shutdown(wait=False, cancel_futures=True)
+        root.destroy()
     
     root.protocol("WM_DELETE_WINDOW", on_closing)
     root.mainloop()
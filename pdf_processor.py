@@ -11,99 +11,358 @@ License: MIT
 """
 
 import argparse
+import hashlib
+import json
 import logging
+import multiprocessing as mp
+import os
+import shutil
 import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Optional
 
 import click
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-from rich.table import Table
-from rich.panel import Panel
 
-from src.core.pdf_extractor import PDFExtractor
-from src.core.csv_converter import CSVConverter
-from src.core.config_manager import ConfigManager
-from src.utils.file_handler import FileHandler
-from src.utils.logger import setup_logger
 
-# Initialize console for rich output
-console = Console()
+def _get_console():
+    """Build the rich console on first use (single shared instance)"""
+    if _LazyConsole._real is None:
+        from rich.console import Console
+        _LazyConsole._real = Console()
+    return _LazyConsole._real
+
+
+class _LazyConsole:
+    """
+    Defers the rich import until the first console write
+
+    Importing rich (and the pandas-backed core modules) dominates CLI
+    cold start; `--help` never touches the console, so it shouldn't
+    pay for them. APIs that need the real Console object (e.g.
+    Progress(console=...)) should call _get_console() instead.
+    """
+    _real = None
+
+    def __getattr__(self, name):
+        return getattr(_get_console(), name)
+
+
+# Console for rich output (materialized on first use)
+console = _LazyConsole()
+
+def _content_hash(pdf_path: str, kwargs: dict, settings: dict) -> str:
+    """
+    SHA-256 of the PDF bytes, processing options and active config
+
+    The configuration goes into the key because it steers the produced
+    CSV too (extraction method pinning, per-backend options): the same
+    file and flags under a different --config must not share a cache
+    entry. The file is streamed in 1 MiB chunks so large PDFs never
+    sit in memory just for hashing.
+    """
+    h = hashlib.sha256()
+    with open(pdf_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    h.update(json.dumps(kwargs, sort_keys=True, default=str).encode('utf-8'))
+    h.update(json.dumps(settings, sort_keys=True, default=str).encode('utf-8'))
+    return h.hexdigest()
+
+
+# Per-process batch worker, built lazily on first task so each pool
+# worker initializes its extraction backends exactly once
+_WORKER_PROCESSOR = None
+
+
+def _drop_page_cache(path: str):
+    """
+    Advise the kernel that a file's pages won't be re-read (Linux)
+
+    Sequential batch runs otherwise fill the page cache with CSVs and
+    already-parsed PDFs, evicting data the next file actually needs.
+    Best-effort: silently a no-op where posix_fadvise is unavailable.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+def _init_batch_worker(config_data: dict):
+    """
+    Build the per-worker processor from the parent's merged config
+
+    Runs once per pool worker (ProcessPoolExecutor initializer). Handing
+    the already-parsed dict across avoids every worker re-reading and
+    re-merging the config file.
+    """
+    global _WORKER_PROCESSOR
+    _WORKER_PROCESSOR = PDFProcessor(config_data=config_data)
+
+
+def _process_one(pdf_path: str, csv_path: str, config_path: Optional[str],
+                 kwargs: dict) -> tuple:
+    """
+    Process one PDF in a pool worker (module-level so it is picklable)
+
+    Args:
+        pdf_path: Path to the input PDF
+        csv_path: Path for the output CSV
+        config_path: Fallback config file if the pool initializer did
+            not run (e.g. direct invocation in tests)
+        kwargs: Processing options
+
+    Returns:
+        Tuple of (pdf_path, success)
+    """
+    global _WORKER_PROCESSOR
+    if _WORKER_PROCESSOR is None:
+        _WORKER_PROCESSOR = PDFProcessor(config_path)
+
+    success = _WORKER_PROCESSOR.process_single_pdf(pdf_path, csv_path,
+                                                   quiet=True, **kwargs)
+    return (pdf_path, success)
+
 
 class PDFProcessor:
     """Main PDF processing class"""
     
-    def __init__(self, config_path: Optional[str] = None):
-        """Initialize PDF processor with optional config file"""
-        self.config = ConfigManager(config_path)
+    def __init__(self, config_path: Optional[str] = None,
+                 config_data: Optional[dict] = None):
+        """
+        Initialize PDF processor with optional config file
+
+        Args:
+            config_path: Path to a config file to load
+            config_data: Already-merged config dict (takes precedence;
+                used by pool workers to skip the file parse)
+        """
+        # Imported here rather than at module scope so the CLI's help
+        # and argument-error paths don't load pandas and the extraction
+        # backends
+        from src.core.pdf_extractor import PDFExtractor
+        from src.core.csv_converter import CSVConverter
+        from src.core.config_manager import ConfigManager
+        from src.utils.file_handler import FileHandler
+        from src.utils.logger import setup_logger
+
+        self.config_path = config_path
+        if config_data is not None:
+            self.config = ConfigManager.from_dict(config_data)
+        else:
+            self.config = ConfigManager(config_path)
         self.extractor = PDFExtractor(self.config)
         self.converter = CSVConverter(self.config)
         self.file_handler = FileHandler()
         self.logger = setup_logger(__name__)
+
+        # Content-hash result cache: identical bytes + identical options
+        # means the previous CSV can be reused without re-parsing.
+        # Off by default (matching the GUI) - writing ~/.pdf2csv_cache
+        # is opt-in via advanced.cache_enabled
+        self.cache_enabled = self.config.get('advanced.cache_enabled', False)
+        self.cache_dir = Path(os.path.expanduser(
+            self.config.get('advanced.cache_dir', '~/.pdf2csv_cache')))
+        if self.cache_enabled:
+            self._sweep_cache()
+
+    def _sweep_cache(self):
+        """Drop cached CSVs older than the configured TTL"""
+        ttl_days = self.config.get('advanced.cache_ttl_days', 30)
+        cutoff = time.time() - ttl_days * 86400
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.warning(f"Cache sweep failed: {str(e)}")
     
-    def process_single_pdf(self, input_path: str, output_path: str, **kwargs) -> bool:
+    def process_single_pdf(self, input_path: str, output_path: str,
+                           quiet: bool = False, batch_writer=None,
+                           **kwargs) -> bool:
         """
         Process a single PDF file and convert to CSV
-        
+
         Args:
             input_path: Path to input PDF file
             output_path: Path to output CSV file
+            quiet: Suppress console output (used by pool workers so
+                child processes don't contend on stderr)
+            batch_writer: Optional BatchCSVWriter; when given, the CSV
+                write is queued on its thread pool instead of blocking
+                here, and the caller confirms outcomes via drain()
             **kwargs: Additional processing options
-            
+
         Returns:
             bool: Success status
         """
         try:
-            console.print(f"📄 Processing PDF: {input_path}")
-            
+            if not quiet:
+                console.print(f"📄 Processing PDF: {input_path}")
+
             # Validate input file
             if not self.file_handler.validate_pdf(input_path):
-                console.print(f"❌ Invalid PDF file: {input_path}", style="red")
+                if not quiet:
+                    console.print(f"❌ Invalid PDF file: {input_path}", style="red")
                 return False
-            
-            # Extract data from PDF
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                console=console
-            ) as progress:
-                
-                task = progress.add_task("Extracting PDF data...", total=100)
-                
-                # Step 1: Extract raw data
-                progress.update(task, advance=25, description="Reading PDF structure...")
-                extracted_data = self.extractor.extract_data(input_path, **kwargs)
-                
-                progress.update(task, advance=25, description="Processing tables...")
-                if not extracted_data:
-                    console.print("❌ No data extracted from PDF", style="red")
+
+            if kwargs.get('preview_only'):
+                # Preview stops after extraction: no CSV conversion and no
+                # file write. Unless the user asked for a specific range,
+                # only the first page is pulled, so the extractor does O(1)
+                # work instead of O(pages).
+                if not kwargs.get('pages'):
+                    kwargs['pages'] = (1,)
+
+                extracted_data = self._extract(input_path, **kwargs)
+                if not extracted_data or not extracted_data.get('tables'):
+                    if not quiet:
+                        console.print("❌ No data extracted from PDF", style="red")
                     return False
-                
-                # Step 2: Convert to CSV format
-                progress.update(task, advance=25, description="Converting to CSV...")
+
+                if not quiet:
+                    self._display_preview(input_path, extracted_data)
+                return True
+
+            # Cache hit: identical input + options short-circuits the
+            # whole extract/convert pipeline to a file copy
+            cache_file = None
+            if self.cache_enabled:
+                cache_file = self.cache_dir / (
+                    f"{_content_hash(input_path, kwargs, self.config.get_all_settings())}.csv")
+                if cache_file.exists():
+                    shutil.copyfile(cache_file, output_path)
+                    self.logger.info(f"Cache hit: {input_path}")
+                    if not quiet:
+                        console.print(f"⚡ Reused cached result for {Path(input_path).name}")
+                    return True
+
+            if quiet or not sys.stderr.isatty():
+                # Plain pipeline: rich's live renderer spawns a repaint
+                # thread whose overhead is measurable on short PDFs and
+                # pointless when output isn't a terminal
+                extracted_data = self._extract(input_path, **kwargs)
+                # A truthy dict with an empty table list is still a dud -
+                # don't spin up the converter for zero rows
+                if not extracted_data or not (extracted_data.get('tables') or extracted_data.get('tables_path')):
+                    if not quiet:
+                        console.print("❌ No data extracted from PDF", style="red")
+                    return False
+
                 csv_data = self.converter.convert_to_csv(extracted_data, **kwargs)
-                
-                # Step 3: Save to file
-                progress.update(task, advance=25, description="Saving CSV file...")
-                success = self.file_handler.save_csv(csv_data, output_path)
-                
-                progress.update(task, completed=100, description="✅ Processing complete!")
-            
+                if batch_writer is not None:
+                    # Queue the write so it overlaps with the next
+                    # file's extraction; drain() reports the outcome
+                    batch_writer.submit(
+                        output_path,
+                        csv_data.encode(kwargs.get('encoding', 'utf-8')))
+                    success = True
+                else:
+                    success = self.file_handler.save_csv(csv_data, output_path)
+            else:
+                from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+
+                # Extract data from PDF under a progress spinner
+                with Progress(
+                    SpinnerColumn(),
+                    TextColumn("[progress.description]{task.description}"),
+                    BarColumn(),
+                    console=_get_console()
+                ) as progress:
+
+                    task = progress.add_task("Extracting PDF data...", total=100)
+
+                    extracted_data = self._extract(input_path, **kwargs)
+                    if not extracted_data or not (extracted_data.get('tables') or extracted_data.get('tables_path')):
+                        console.print("❌ No data extracted from PDF", style="red")
+                        return False
+
+                    csv_data = self.converter.convert_to_csv(extracted_data, **kwargs)
+                    success = self.file_handler.save_csv(csv_data, output_path)
+
+                    # One final update - the old 25% step updates forced
+                    # extra repaints without user-visible granularity
+                    progress.update(task, completed=100, description="✅ Processing complete!")
+
             if success:
-                # Display results
-                self._display_results(input_path, output_path, extracted_data)
+                if batch_writer is None:
+                    # Deferred writes haven't hit disk yet - the cache
+                    # copy and page-cache drop need the file to exist
+                    self._populate_cache(cache_file, output_path)
+
+                if quiet:
+                    # Batch workers churn through many files sequentially;
+                    # neither the written CSV nor the consumed PDF will be
+                    # touched again, so give their pages back to the kernel
+                    if batch_writer is None:
+                        _drop_page_cache(output_path)
+                    _drop_page_cache(input_path)
+
+                if not quiet:
+                    # Display results
+                    self._display_results(input_path, output_path, extracted_data)
                 return True
             else:
-                console.print("❌ Failed to save CSV file", style="red")
+                if not quiet:
+                    console.print("❌ Failed to save CSV file", style="red")
                 return False
-                
+
         except Exception as e:
             self.logger.error(f"Error processing PDF {input_path}: {str(e)}")
-            console.print(f"❌ Error: {str(e)}", style="red")
+            if not quiet:
+                console.print(f"❌ Error: {str(e)}", style="red")
             return False
     
+    def _extract(self, input_path: str, **kwargs):
+        """
+        Extract data, sharding large PDFs into parallel page ranges
+
+        A single multi-hundred-page document otherwise dominates batch
+        runtime; when it spans at least two page chunks (and no explicit
+        page selection was requested) extraction runs via
+        extract_data_parallel instead.
+        """
+        if not kwargs.get('pages'):
+            chunk_pages = self.config.get('advanced.page_chunk_size', 25)
+            try:
+                info = self.extractor.get_pdf_info(input_path, metadata_only=True)
+                total_pages = info.get('total_pages', 0)
+            except Exception:
+                total_pages = 0
+
+            if total_pages >= 2 * chunk_pages:
+                workers = min(-(-total_pages // chunk_pages),
+                              self.config.get('advanced.max_workers', 4))
+                return self.extractor.extract_data_parallel(input_path,
+                                                            workers=workers,
+                                                            **kwargs)
+
+        return self.extractor.extract_data(input_path, **kwargs)
+
+    def _populate_cache(self, cache_file: Optional[Path], output_path: str):
+        """Store a produced CSV in the content-hash cache (atomic)"""
+        if cache_file is None:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix('.tmp')
+            shutil.copyfile(output_path, tmp_file)
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            self.logger.warning(f"Failed to populate cache: {str(e)}")
+
     def process_batch(self, input_dir: str, output_dir: str, **kwargs) -> dict:
         """
         Process multiple PDF files in a directory
@@ -122,47 +381,157 @@ class PDFProcessor:
         # Create output directory if it doesn't exist
         output_path.mkdir(parents=True, exist_ok=True)
         
-        # Find all PDF files
-        pdf_files = list(input_path.glob("*.pdf"))
-        
+        # Find all PDF files with a single scandir pass: the suffix check
+        # runs on the entry name before any stat, and is_file() reuses the
+        # type info readdir already returned instead of a fresh syscall
+        with os.scandir(input_path) as entries:
+            pdf_files = sorted(
+                (entry.name, entry.path) for entry in entries
+                if entry.name.lower().endswith('.pdf')
+                and entry.is_file(follow_symlinks=False)
+            )
+
         if not pdf_files:
             console.print(f"❌ No PDF files found in {input_dir}", style="red")
             return {"success": 0, "failed": 0, "total": 0}
-        
+
         console.print(f"📁 Found {len(pdf_files)} PDF files to process")
-        
-        results = {"success": 0, "failed": 0, "total": len(pdf_files)}
+
+        from rich.progress import Progress
+
+        results = Counter(success=0, failed=0, total=len(pdf_files))
         failed_files = []
-        
-        # Process each PDF file
-        with Progress(console=console) as progress:
+
+        # Plain string join per file - no Path construction in the loop
+        out_dir = str(output_path)
+
+        # PDF parsing is CPU-bound and independent per file, so spread
+        # the batch across worker processes when enabled
+        workers = 1
+        if self.config.get('advanced.parallel_processing', True):
+            workers = min(self.config.get('advanced.max_workers', 4), len(pdf_files))
+
+        # Throttle progress chatter: description repaints only make sense
+        # on a real terminal, and only every Nth file on big batches;
+        # advances are accumulated and flushed in blocks
+        is_tty = sys.stderr.isatty()
+        desc_stride = max(1, len(pdf_files) // 200)
+        advance_block = 8
+
+        with Progress(console=_get_console()) as progress:
             batch_task = progress.add_task("Processing PDFs...", total=len(pdf_files))
-            
-            for pdf_file in pdf_files:
-                progress.update(batch_task, description=f"Processing {pdf_file.name}")
-                
-                # Generate output filename
-                csv_filename = pdf_file.stem + ".csv"
-                csv_path = output_path / csv_filename
-                
-                # Process the file
-                success = self.process_single_pdf(str(pdf_file), str(csv_path), **kwargs)
-                
-                if success:
-                    results["success"] += 1
-                else:
-                    results["failed"] += 1
-                    failed_files.append(pdf_file.name)
-                
-                progress.update(batch_task, advance=1)
-        
+            pending_advance = 0
+
+            if workers > 1:
+                # Fork avoids re-import cost where available (spawn on
+                # Windows/macOS)
+                ctx = mp.get_context('fork') if 'fork' in mp.get_all_start_methods() else None
+
+                with ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                                         initializer=_init_batch_worker,
+                                         initargs=(self.config.get_all_settings(),)) as executor:
+                    futures = {
+                        executor.submit(_process_one, pdf_path,
+                                        os.path.join(out_dir, name[:-4] + ".csv"),
+                                        self.config_path, kwargs): name
+                        for name, pdf_path in pdf_files
+                    }
+
+                    for i, future in enumerate(as_completed(futures)):
+                        name = futures[future]
+                        try:
+                            _, success = future.result()
+                        except Exception as e:
+                            self.logger.error(f"Worker failed on {name}: {str(e)}")
+                            success = False
+
+                        if success:
+                            results["success"] += 1
+                        else:
+                            results["failed"] += 1
+                            failed_files.append(name)
+
+                        pending_advance += 1
+                        if pending_advance >= advance_block:
+                            progress.update(batch_task, advance=pending_advance)
+                            pending_advance = 0
+                        if is_tty and i % desc_stride == 0:
+                            progress.update(batch_task, description=f"Processed {name}")
+            else:
+                from src.core.csv_converter import BatchCSVWriter
+
+                # Overlap CSV writes with the next file's extraction:
+                # payloads are queued on the writer's thread pool and
+                # per-file outcomes reconciled after the loop
+                batch_writer = BatchCSVWriter()
+                deferred = {}
+
+                for i, (name, pdf_path) in enumerate(pdf_files):
+                    if is_tty and i % desc_stride == 0:
+                        progress.update(batch_task, description=f"Processing {name}")
+
+                    # Generate output filename
+                    csv_path = os.path.join(out_dir, name[:-4] + ".csv")
+
+                    # Process the file
+                    success = self.process_single_pdf(pdf_path, csv_path,
+                                                      quiet=True,
+                                                      batch_writer=batch_writer,
+                                                      **kwargs)
+
+                    if success:
+                        # Counted once the queued write is confirmed
+                        deferred[csv_path] = name
+                    else:
+                        results["failed"] += 1
+                        failed_files.append(name)
+
+                    pending_advance += 1
+                    if pending_advance >= advance_block:
+                        progress.update(batch_task, advance=pending_advance)
+                        pending_advance = 0
+
+                # Cache hits copy their file directly and never hit the
+                # writer, so a missing entry means already written
+                write_results = batch_writer.drain()
+                for csv_path, name in deferred.items():
+                    if write_results.get(csv_path, True):
+                        results["success"] += 1
+                    else:
+                        results["failed"] += 1
+                        failed_files.append(name)
+
+            if pending_advance:
+                progress.update(batch_task, advance=pending_advance)
+
         # Display batch results
+        results = dict(results)
         self._display_batch_results(results, failed_files)
         return results
     
+    def _display_preview(self, input_path: str, extracted_data: dict, max_rows: int = 10):
+        """Render the first rows of the first extracted table"""
+        import pandas as pd
+        from rich.table import Table
+
+        df = extracted_data['tables'][0]
+        shown = min(max_rows, len(df))
+        table = Table(title=f"Preview: {Path(input_path).name} (first {shown} rows)")
+
+        for col in df.columns:
+            table.add_column(str(col), style="cyan")
+
+        for row in df.head(max_rows).itertuples(index=False):
+            table.add_row(*("" if pd.isna(value) else str(value) for value in row))
+
+        console.print(table)
+        console.print(f"\n👁️ Preview only - no CSV written "
+                      f"({len(extracted_data.get('tables', []))} table(s) found)")
+
     def _display_results(self, input_path: str, output_path: str, extracted_data: dict):
         """Display processing results in a formatted table"""
-        
+        from rich.table import Table
+
         table = Table(title="Processing Results")
         table.add_column("Metric", style="cyan")
         table.add_column("Value", style="green")
@@ -180,7 +549,8 @@ class PDFProcessor:
     
     def _display_batch_results(self, results: dict, failed_files: List[str]):
         """Display batch processing results"""
-        
+        from rich.panel import Panel
+
         panel_content = f"""
         Total Files: {results['total']}
         ✅ Success: {results['success']}
@@ -224,7 +594,9 @@ def main(input, output, input_dir, output_dir, config, method, pages, template,
         logging.basicConfig(level=logging.DEBUG)
     else:
         logging.basicConfig(level=logging.INFO)
-    
+
+    from rich.panel import Panel
+
     # Display welcome message
     console.print(Panel(
         "🔄 PDF to CSV Data Processor v1.0.0\n"
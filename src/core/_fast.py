@@ -0,0 +1,154 @@
+"""
+Accelerated helpers for hot data-cleaning loops
+
+Small numeric kernels shared by the converters. When numba is installed
+the kernels are JIT-compiled (cached on disk so the compile cost is paid
+once per machine); otherwise pure-numpy reductions are used, which are
+already vectorized and adequate for typical table sizes. The JIT path
+can also be turned off via config (advanced.use_numba) - see
+set_use_numba().
+
+The kernels deliberately operate on boolean null-masks (``df.isna()``)
+rather than the string cells themselves - object/string arrays do not
+compile under nopython mode, but the mask reductions are plain numeric
+loops that do.
+"""
+
+import numpy as np
+
+try:
+    import numba
+    HAVE_NUMBA = True
+except ImportError:
+    numba = None
+    HAVE_NUMBA = False
+
+# Delimiter codes emitted by classify_lines, in split priority order
+DELIM_NONE = 0
+DELIM_TAB = 1
+DELIM_PIPE = 2
+DELIM_SPACES = 3
+
+# Whether the JIT kernels are dispatched; flipped by set_use_numba()
+# when advanced.use_numba is disabled in config
+_use_numba = HAVE_NUMBA
+
+
+def set_use_numba(enabled: bool):
+    """
+    Select the JIT kernels or the numpy fallbacks
+
+    Called by the components that read advanced.use_numba from config;
+    asking for numba when it isn't installed leaves the numpy
+    fallbacks in place.
+    """
+    global _use_numba
+    _use_numba = bool(enabled) and HAVE_NUMBA
+
+
+def find_line_offsets(buf):
+    """(start, end) byte offsets of each line in a uint8 text buffer"""
+    newlines = np.nonzero(buf == 10)[0]
+    starts = np.empty(len(newlines) + 1, dtype=np.int64)
+    ends = np.empty(len(newlines) + 1, dtype=np.int64)
+    starts[0] = 0
+    starts[1:] = newlines + 1
+    ends[:-1] = newlines
+    ends[-1] = len(buf)
+    return starts, ends
+
+
+def _classify_lines_np(buf, starts, ends):
+    """Per-line delimiter code from cumulative-sum range queries"""
+    if len(buf) == 0:
+        return np.zeros(len(starts), dtype=np.uint8)
+
+    cs_tab = np.cumsum(buf == 9)
+    cs_pipe = np.cumsum(buf == 124)
+    double = np.zeros(len(buf), dtype=np.int64)
+    if len(buf) > 1:
+        double[1:] = (buf[1:] == 32) & (buf[:-1] == 32)
+    cs_double = np.cumsum(double)
+
+    def per_line(cs):
+        lo = np.where(starts > 0, cs[starts - 1], 0)
+        hi = cs[np.maximum(ends - 1, 0)]
+        return np.where(ends > starts, hi - lo, 0)
+
+    out = np.zeros(len(starts), dtype=np.uint8)
+    out[per_line(cs_double) > 0] = DELIM_SPACES
+    out[per_line(cs_pipe) > 0] = DELIM_PIPE
+    out[per_line(cs_tab) > 0] = DELIM_TAB
+    return out
+
+
+def _empty_rows_np(na_mask):
+    """Row-wise all() over a 2-D null mask"""
+    return na_mask.all(axis=1)
+
+
+if HAVE_NUMBA:
+
+    @numba.njit(cache=True)
+    def _classify_lines_jit(buf, starts, ends):
+        """Per-line delimiter code from one scan of a uint8 text buffer"""
+        n = len(starts)
+        out = np.zeros(n, dtype=np.uint8)
+        for i in range(n):
+            has_pipe = False
+            has_spaces = False
+            prev_space = False
+            for k in range(starts[i], ends[i]):
+                c = buf[k]
+                if c == 9:  # tab wins outright
+                    out[i] = 1
+                    has_pipe = False
+                    has_spaces = False
+                    break
+                if c == 124:
+                    has_pipe = True
+                if c == 32:
+                    if prev_space:
+                        has_spaces = True
+                    prev_space = True
+                else:
+                    prev_space = False
+            if has_pipe:
+                out[i] = 2
+            elif has_spaces:
+                out[i] = 3
+        return out
+
+    @numba.njit(cache=True, fastmath=True)
+    def _empty_rows_jit(na_mask):
+        """Row-wise all() over a 2-D null mask"""
+        n_rows, n_cols = na_mask.shape
+        out = np.empty(n_rows, dtype=np.bool_)
+        for i in range(n_rows):
+            empty = True
+            for j in range(n_cols):
+                if not na_mask[i, j]:
+                    empty = False
+                    break
+            out[i] = empty
+        return out
+
+
+def classify_lines(buf, starts, ends):
+    """
+    Per-line delimiter code for a uint8 text buffer
+
+    Returns DELIM_TAB, DELIM_PIPE or DELIM_SPACES (double space) per
+    line, 0 for lines with no tabular delimiter, so the caller only
+    decodes and splits the candidate lines.
+    """
+    if _use_numba:
+        return _classify_lines_jit(buf, starts, ends)
+    return _classify_lines_np(buf, starts, ends)
+
+
+def empty_rows(na_mask):
+    """Row-wise all() over a 2-D null mask"""
+    if _use_numba:
+        return _empty_rows_jit(na_mask)
+    return _empty_rows_np(na_mask)
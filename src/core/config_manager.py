@@ -4,15 +4,47 @@ Configuration Manager
 Handles loading and management of configuration settings for the PDF processor.
 """
 
+import codecs
+import copy
 import json
-import yaml
 import logging
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 import os
 
 from src.utils.logger import setup_logger
 
+try:
+    import orjson as _orjson  # optional: C-backed JSON parse/serialize
+except ImportError:
+    _orjson = None
+
+# Extraction methods accepted by validate_config
+_VALID_METHODS = frozenset(['auto', 'tabula', 'camelot', 'pdfplumber', 'pypdf2'])
+
+# Chosen yaml Loader/Dumper, resolved once on first yaml config use
+_YAML_LOADER = None
+_YAML_DUMPER = None
+
+
+def _yaml():
+    """
+    Import yaml on demand and pick the C-accelerated Loader/Dumper
+
+    LibYAML bindings (CSafeLoader/CSafeDumper) parse several times faster
+    than the pure-Python classes; fall back silently when not built.
+    """
+    global _YAML_LOADER, _YAML_DUMPER
+    import yaml
+
+    if _YAML_LOADER is None:
+        _YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        _YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+    return yaml
+
+
 class ConfigManager:
     """Manages configuration settings for PDF processing"""
     
@@ -25,6 +57,9 @@ class ConfigManager:
         """
         self.logger = setup_logger(__name__)
         self.config_data = {}
+        self._flat = {}
+        self._snapshot = None
+        self._config_cache = {}
         
         # Default configuration
         self.default_config = {
@@ -46,15 +81,49 @@ class ConfigManager:
                 'verbose_logging': False,
                 'parallel_processing': True,
                 'max_workers': 4,
-                'chunk_size': 1000
+                'chunk_size': 1000,
+                'page_chunk_size': 25,
+                'use_numba': True,
+                'cache_enabled': False,
+                'cache_dir': '~/.pdf2csv_cache',
+                'cache_ttl_days': 30
             }
         }
-        
+
+        # Pristine snapshot of the defaults: config_data always works on a
+        # deep copy, so set() can never alias into the nested default dicts
+        self._default_snapshot = copy.deepcopy(self.default_config)
+
         # Load configuration
         if config_path:
             self.load_config(config_path)
         else:
             self.load_default_config()
+
+    @classmethod
+    def from_dict(cls, config_data: Dict[str, Any]) -> 'ConfigManager':
+        """
+        Build a manager from an already-merged config dict
+
+        Used to hand the parent's parsed configuration to worker
+        processes so each worker skips the file read/parse/merge.
+
+        Args:
+            config_data: Fully merged configuration dictionary
+
+        Returns:
+            ConfigManager serving the given data
+        """
+        manager = cls.__new__(cls)
+        manager.logger = setup_logger(cls.__module__)
+        manager.config_data = copy.deepcopy(config_data)
+        manager._flat = {}
+        manager._snapshot = None
+        manager._config_cache = {}
+        manager._default_snapshot = copy.deepcopy(config_data)
+        manager.default_config = manager._default_snapshot
+        manager._reindex()
+        return manager
     
     def load_config(self, config_path: str) -> bool:
         """
@@ -79,9 +148,14 @@ class ConfigManager:
             
             with open(config_path, 'r', encoding='utf-8') as f:
                 if suffix == '.json':
-                    config_data = json.load(f)
+                    if _orjson is not None:
+                        config_data = _orjson.loads(f.read())
+                    else:
+                        config_data = json.load(f)
                 elif suffix in ['.yaml', '.yml']:
-                    config_data = yaml.safe_load(f)
+                    # Deferred: JSON-only users never pay the yaml import
+                    yaml = _yaml()
+                    config_data = yaml.load(f, Loader=_YAML_LOADER)
                 else:
                     self.logger.error(f"Unsupported config format: {suffix}")
                     self.load_default_config()
@@ -89,7 +163,8 @@ class ConfigManager:
             
             # Merge with defaults
             self.config_data = self._merge_config(self.default_config, config_data)
-            
+            self._reindex()
+
             self.logger.info(f"Configuration loaded from: {config_path}")
             return True
             
@@ -100,8 +175,32 @@ class ConfigManager:
     
     def load_default_config(self):
         """Load default configuration"""
-        self.config_data = self.default_config.copy()
+        self.config_data = copy.deepcopy(self._default_snapshot)
+        self._reindex()
         self.logger.info("Using default configuration")
+
+    def _reindex(self):
+        """
+        Rebuild the flat dotted-path index after a mutation
+
+        get() serves from this index with a single hash probe instead of
+        splitting the key and walking the nested dict on every call.
+        Intermediate dict nodes are indexed too, so lookups like
+        'extraction_methods.tabula' still return their sub-dict.
+        """
+        flat = {}
+
+        def _flatten(prefix: str, data: Dict):
+            for key, value in data.items():
+                dotted = f"{prefix}.{key}" if prefix else key
+                flat[dotted] = value
+                if isinstance(value, dict):
+                    _flatten(dotted, value)
+
+        _flatten('', self.config_data)
+        self._flat = flat
+        self._snapshot = None
+        self._config_cache = {}
     
     def save_config(self, config_path: str, config_data: Optional[Dict] = None) -> bool:
         """
@@ -125,13 +224,16 @@ class ConfigManager:
             suffix = config_path.suffix.lower()
             
             with open(config_path, 'w', encoding='utf-8') as f:
-                if suffix == '.json':
-                    json.dump(config_data, f, indent=2, ensure_ascii=False)
-                elif suffix in ['.yaml', '.yml']:
-                    yaml.dump(config_data, f, default_flow_style=False, 
+                if suffix in ['.yaml', '.yml']:
+                    yaml = _yaml()
+                    yaml.dump(config_data, f, Dumper=_YAML_DUMPER,
+                             default_flow_style=False,
                              allow_unicode=True, indent=2)
-                else:
+                elif _orjson is not None:
                     # Default to JSON
+                    f.write(_orjson.dumps(config_data,
+                                          option=_orjson.OPT_INDENT_2).decode('utf-8'))
+                else:
                     json.dump(config_data, f, indent=2, ensure_ascii=False)
             
             self.logger.info(f"Configuration saved to: {config_path}")
@@ -152,20 +254,7 @@ class ConfigManager:
         Returns:
             Configuration value
         """
-        try:
-            keys = key.split('.')
-            value = self.config_data
-            
-            for k in keys:
-                if isinstance(value, dict) and k in value:
-                    value = value[k]
-                else:
-                    return default
-            
-            return value
-            
-        except Exception:
-            return default
+        return self._flat.get(key, default)
     
     def set(self, key: str, value: Any) -> bool:
         """
@@ -178,83 +267,117 @@ class ConfigManager:
         Returns:
             Success status
         """
-        try:
-            keys = key.split('.')
-            config = self.config_data
-            
-            # Navigate to parent
-            for k in keys[:-1]:
-                if k not in config:
-                    config[k] = {}
-                config = config[k]
-            
-            # Set value
-            config[keys[-1]] = value
-            
+        # Top-level keys skip the split/walk entirely
+        if '.' not in key:
+            self.config_data[key] = value
+            self._reindex()
             return True
-            
-        except Exception as e:
-            self.logger.error(f"Failed to set config value {key}: {str(e)}")
-            return False
+
+        keys = key.split('.')
+        config = self.config_data
+
+        # Navigate to parent: setdefault probes the dict once per level,
+        # and non-dict intermediates are replaced explicitly instead of
+        # catching TypeError
+        for k in keys[:-1]:
+            node = config.setdefault(k, {})
+            if not isinstance(node, dict):
+                node = config[k] = {}
+            config = node
+
+        config[keys[-1]] = value
+        self._reindex()
+
+        return True
     
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a flat, read-only view of the configuration keyed by dotted paths
+
+        Built once and cached until a setting changes, so repeated lookups
+        in hot loops cost a single dict hash instead of a dotted-path walk.
+
+        Returns:
+            Read-only mapping of dotted keys to values
+        """
+        if self._snapshot is None:
+            self._snapshot = MappingProxyType(
+                {k: v for k, v in self._flat.items() if not isinstance(v, dict)})
+
+        return self._snapshot
+
     def _merge_config(self, default: Dict, user: Dict) -> Dict:
         """
-        Merge user config with default config
-        
+        Merge user config into a deep copy of the default config
+
+        Walks both trees with an explicit stack and updates the copy in
+        place - no recursion and no per-level dict copies.
+
         Args:
             default: Default configuration
             user: User configuration
-            
+
         Returns:
             Merged configuration
         """
-        try:
-            merged = default.copy()
-            
-            for key, value in user.items():
-                if key in merged and isinstance(merged[key], dict) and isinstance(value, dict):
-                    merged[key] = self._merge_config(merged[key], value)
-                else:
-                    merged[key] = value
-            
-            return merged
-            
-        except Exception as e:
-            self.logger.error(f"Config merge failed: {str(e)}")
-            return default
+        merged = copy.deepcopy(default)
+
+        stack = [(merged, user)]
+        while stack:
+            base, overlay = stack.pop()
+            for key, value in overlay.items():
+                if isinstance(value, dict):
+                    # Single probe instead of `key in base` + `base[key]`
+                    node = base.get(key)
+                    if isinstance(node, dict):
+                        stack.append((node, value))
+                        continue
+                base[key] = value
+
+        return merged
     
     def get_extraction_config(self) -> Dict[str, Any]:
-        """Get extraction-specific configuration"""
-        return {
-            'method': self.get('extraction_method', 'auto'),
-            'table_detection': self.get('table_detection', True),
-            'text_patterns': self.get('text_patterns', ['table']),
-            'tabula_options': self.get('extraction_methods.tabula', {}),
-            'camelot_options': self.get('extraction_methods.camelot', {}),
-            'pdfplumber_options': self.get('extraction_methods.pdfplumber', {}),
-            'ocr_settings': self.get('ocr_settings', {})
-        }
-    
+        """Get extraction-specific configuration (cached until a change)"""
+        cached = self._config_cache.get('extraction')
+        if cached is None:
+            cached = self._config_cache['extraction'] = {
+                'method': self.get('extraction_method', 'auto'),
+                'table_detection': self.get('table_detection', True),
+                'text_patterns': self.get('text_patterns', ['table']),
+                'tabula_options': self.get('extraction_methods.tabula', {}),
+                'camelot_options': self.get('extraction_methods.camelot', {}),
+                'pdfplumber_options': self.get('extraction_methods.pdfplumber', {}),
+                'ocr_settings': self.get('ocr_settings', {})
+            }
+        return dict(cached)
+
     def get_output_config(self) -> Dict[str, Any]:
-        """Get output-specific configuration"""
-        return {
-            'delimiter': self.get('output_format.delimiter', ','),
-            'encoding': self.get('output_format.encoding', 'utf-8'),
-            'header_row': self.get('output_format.header_row', True),
-            'clean_data': self.get('processing.clean_data', True),
-            'merge_cells': self.get('processing.merge_cells', True),
-            'skip_empty_rows': self.get('processing.skip_empty_rows', True)
-        }
-    
+        """Get output-specific configuration (cached until a change)"""
+        cached = self._config_cache.get('output')
+        if cached is None:
+            cached = self._config_cache['output'] = {
+                'delimiter': self.get('output_format.delimiter', ','),
+                'encoding': self.get('output_format.encoding', 'utf-8'),
+                'header_row': self.get('output_format.header_row', True),
+                'clean_data': self.get('processing.clean_data', True),
+                'merge_cells': self.get('processing.merge_cells', True),
+                'skip_empty_rows': self.get('processing.skip_empty_rows', True)
+            }
+        return dict(cached)
+
     def get_processing_config(self) -> Dict[str, Any]:
-        """Get processing-specific configuration"""
-        return {
-            'verbose_logging': self.get('advanced.verbose_logging', False),
-            'parallel_processing': self.get('advanced.parallel_processing', True),
-            'max_workers': self.get('advanced.max_workers', 4),
-            'chunk_size': self.get('advanced.chunk_size', 1000),
-            'ocr_enabled': self.get('processing.ocr_enabled', False)
-        }
+        """Get processing-specific configuration (cached until a change)"""
+        cached = self._config_cache.get('processing')
+        if cached is None:
+            cached = self._config_cache['processing'] = {
+                'verbose_logging': self.get('advanced.verbose_logging', False),
+                'parallel_processing': self.get('advanced.parallel_processing', True),
+                'max_workers': self.get('advanced.max_workers', 4),
+                'chunk_size': self.get('advanced.chunk_size', 1000),
+                'use_numba': self.get('advanced.use_numba', True),
+                'ocr_enabled': self.get('processing.ocr_enabled', False)
+            }
+        return dict(cached)
     
     def update_settings(self, settings: Dict[str, Any]) -> bool:
         """
@@ -280,7 +403,8 @@ class ConfigManager:
     def reset_to_defaults(self) -> bool:
         """Reset configuration to defaults"""
         try:
-            self.config_data = self.default_config.copy()
+            self.config_data = copy.deepcopy(self._default_snapshot)
+            self._reindex()
             self.logger.info("Configuration reset to defaults")
             return True
             
@@ -290,54 +414,56 @@ class ConfigManager:
     
     def validate_config(self) -> Dict[str, Any]:
         """
-        Validate current configuration
-        
+        Validate current configuration (memoized until a setting changes)
+
         Returns:
             Validation results
         """
+        cached = self._config_cache.get('validation')
+        if cached is not None:
+            return {'valid': cached['valid'],
+                    'errors': list(cached['errors']),
+                    'warnings': list(cached['warnings'])}
+
+        errors = []
+        warnings = []
+
+        # Check required fields
+        required_fields = [
+            'extraction_method',
+            'output_format.delimiter',
+            'output_format.encoding'
+        ]
+
+        for field in required_fields:
+            if self.get(field) is None:
+                errors.append(f"Missing required field: {field}")
+
+        # Check extraction method (non-string values are invalid, and
+        # unhashable ones would blow up the frozenset membership test)
+        method = self.get('extraction_method')
+        if not isinstance(method, str) or method not in _VALID_METHODS:
+            errors.append(f"Invalid extraction method. Must be one of: {sorted(_VALID_METHODS)}")
+
+        # Check encoding (registry lookup - no throwaway encode)
         try:
-            errors = []
-            warnings = []
-            
-            # Check required fields
-            required_fields = [
-                'extraction_method',
-                'output_format.delimiter',
-                'output_format.encoding'
-            ]
-            
-            for field in required_fields:
-                if self.get(field) is None:
-                    errors.append(f"Missing required field: {field}")
-            
-            # Check extraction method
-            valid_methods = ['auto', 'tabula', 'camelot', 'pdfplumber', 'pypdf2']
-            if self.get('extraction_method') not in valid_methods:
-                errors.append(f"Invalid extraction method. Must be one of: {valid_methods}")
-            
-            # Check encoding
-            try:
-                'test'.encode(self.get('output_format.encoding', 'utf-8'))
-            except LookupError:
-                errors.append(f"Invalid encoding: {self.get('output_format.encoding')}")
-            
-            # Check max_workers
-            max_workers = self.get('advanced.max_workers', 4)
-            if not isinstance(max_workers, int) or max_workers < 1:
-                warnings.append("max_workers should be a positive integer")
-            
-            return {
-                'valid': len(errors) == 0,
-                'errors': errors,
-                'warnings': warnings
-            }
-            
-        except Exception as e:
-            return {
-                'valid': False,
-                'errors': [f"Config validation failed: {str(e)}"],
-                'warnings': []
-            }
+            codecs.lookup(self.get('output_format.encoding', 'utf-8'))
+        except (LookupError, TypeError):
+            errors.append(f"Invalid encoding: {self.get('output_format.encoding')}")
+
+        # Check max_workers
+        max_workers = self.get('advanced.max_workers', 4)
+        if not isinstance(max_workers, int) or max_workers < 1:
+            warnings.append("max_workers should be a positive integer")
+
+        self._config_cache['validation'] = {
+            'valid': len(errors) == 0,
+            'errors': errors,
+            'warnings': warnings
+        }
+        return {'valid': len(errors) == 0,
+                'errors': list(errors),
+                'warnings': list(warnings)}
     
     def get_all_settings(self) -> Dict[str, Any]:
         """Get all current settings"""
@@ -4,14 +4,108 @@ CSV Converter
 Handles conversion of extracted PDF data to CSV format with various options.
 """
 
+import numpy as np
 import pandas as pd
 import logging
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 import csv
+import io
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from io import StringIO
 
+from functools import lru_cache
+
 from src.utils.logger import setup_logger
+from src.core import _fast
+from src.core.pdf_extractor import iter_table_shards
+
+# Optional vectorized CSV writer - used for large tables when available
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+    pa_csv = None
+
+# Optional streaming Excel engine - bounded memory on big sheets
+try:
+    import xlsxwriter  # noqa: F401 - probed for the pandas engine only
+    _HAS_XLSXWRITER = True
+except ImportError:
+    _HAS_XLSXWRITER = False
+
+# Below this row count the pandas writer is already fast enough that the
+# Arrow conversion overhead isn't worth paying
+_ARROW_MIN_ROWS = 10000
+
+
+@lru_cache(maxsize=8)
+def _union_columns(col_sig: tuple) -> tuple:
+    """
+    Sorted union of column names for a table-set signature
+
+    Re-merging the same page tables (e.g. once per export format) repeats
+    the set-union and sort; the signature of per-table column tuples is
+    tiny and hashable, so memoize it.
+    """
+    all_columns = set()
+    for columns in col_sig:
+        all_columns.update(columns)
+    return tuple(sorted(all_columns, key=str))
+
+class BatchCSVWriter:
+    """
+    Overlapped writer for many small CSV outputs
+
+    Batch jobs produce lots of small files whose blocking write latency
+    adds up when paid one at a time. submit() queues each payload on a
+    small thread pool (writes release the GIL) and drain() collects the
+    results, so queueing the next file overlaps with flushing the last.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self.logger = setup_logger(__name__)
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+        self._futures = {}
+
+    def submit(self, path: str, data: bytes):
+        """Queue one file write; call drain() to collect outcomes"""
+        self._futures[self._pool.submit(self._write, path, data)] = path
+
+    @staticmethod
+    def _write(path: str, data: bytes):
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
+    def drain(self) -> Dict[str, bool]:
+        """
+        Wait for all queued writes and shut the pool down
+
+        Returns:
+            Mapping of path to write success
+        """
+        results = {}
+        for future in as_completed(self._futures):
+            path = self._futures[future]
+            try:
+                future.result()
+                results[path] = True
+            except Exception as e:
+                self.logger.error(f"Failed to write {path}: {str(e)}")
+                results[path] = False
+
+        self._futures = {}
+        self._pool.shutdown(wait=True)
+        return results
+
 
 class CSVConverter:
     """Converts extracted PDF data to CSV format"""
@@ -20,6 +114,10 @@ class CSVConverter:
         """Initialize CSV converter with configuration"""
         self.config = config_manager
         self.logger = setup_logger(__name__)
+
+        # Honor the config's JIT switch for the shared _fast kernels
+        if config_manager is not None:
+            _fast.set_use_numba(config_manager.get('advanced.use_numba', True))
     
     def convert_to_csv(self, extracted_data: Dict[str, Any], **kwargs) -> str:
         """
@@ -34,11 +132,22 @@ class CSVConverter:
         """
         try:
             tables = extracted_data.get('tables', [])
-            
+
             if not tables:
+                tables_path = extracted_data.get('tables_path')
+                if tables_path:
+                    # Spooled extraction (stream_to_disk): read the parquet
+                    # shards back one at a time instead of holding every
+                    # table in memory at once
+                    buf = StringIO()
+                    self._stream_shards_to_csv(tables_path, buf,
+                                               kwargs.get('delimiter', ','),
+                                               kwargs.get('header_row', True))
+                    self._discard_spool(extracted_data)
+                    return buf.getvalue()
                 self.logger.warning("No tables found in extracted data")
                 return ""
-            
+
             # Get conversion options
             delimiter = kwargs.get('delimiter', ',')
             encoding = kwargs.get('encoding', 'utf-8')
@@ -46,9 +155,15 @@ class CSVConverter:
             merge_tables = kwargs.get('merge_tables', len(tables) > 1)
             
             if merge_tables and len(tables) > 1:
-                # Merge multiple tables
-                merged_df = self._merge_tables(tables, **kwargs)
-                csv_data = self._dataframe_to_csv(merged_df, delimiter, header_row)
+                if self._can_stream_tables(tables, **kwargs):
+                    # No cleaning requested and layouts match: serialize
+                    # each table straight into one buffer and skip the
+                    # concat copy entirely
+                    csv_data = self._stream_tables_to_csv(tables, delimiter, header_row)
+                else:
+                    # Merge multiple tables
+                    merged_df = self._merge_tables(tables, **kwargs)
+                    csv_data = self._dataframe_to_csv(merged_df, delimiter, header_row)
             else:
                 # Convert first table or handle single table
                 main_table = tables[0] if tables else pd.DataFrame()
@@ -61,6 +176,201 @@ class CSVConverter:
             self.logger.error(f"CSV conversion failed: {str(e)}")
             raise
     
+    def write_csv(self, extracted_data: Dict[str, Any], file_obj, **kwargs) -> int:
+        """
+        Stream extracted data as CSV directly to an open binary file object
+
+        Unlike convert_to_csv, this never materializes the full CSV string
+        in memory - rows are written through a buffered text wrapper as
+        they are read from the tables.
+
+        Args:
+            extracted_data: Data extracted from PDF
+            file_obj: Open binary file object to write to
+            **kwargs: Conversion options
+
+        Returns:
+            Number of data rows written
+        """
+        try:
+            tables = extracted_data.get('tables', [])
+
+            # Get conversion options
+            delimiter = kwargs.get('delimiter', ',')
+            encoding = kwargs.get('encoding', 'utf-8')
+            header_row = kwargs.get('header_row', True)
+
+            if not tables:
+                tables_path = extracted_data.get('tables_path')
+                if tables_path:
+                    # Spooled extraction (stream_to_disk): stream each
+                    # parquet shard straight into the file, so neither
+                    # the tables nor the CSV are ever whole in memory
+                    text_wrapper = io.TextIOWrapper(file_obj, encoding=encoding,
+                                                    newline='', write_through=False)
+                    try:
+                        rows_written = self._stream_shards_to_csv(
+                            tables_path, text_wrapper, delimiter, header_row)
+                    finally:
+                        text_wrapper.flush()
+                        text_wrapper.detach()
+
+                    self._discard_spool(extracted_data)
+                    self.logger.info(f"Streamed {rows_written} rows to CSV")
+                    return rows_written
+                self.logger.warning("No tables found in extracted data")
+                return 0
+
+            merge_tables = kwargs.get('merge_tables', len(tables) > 1)
+
+            if merge_tables and len(tables) > 1:
+                df = self._merge_tables(tables, **kwargs)
+            else:
+                df = tables[0] if tables else pd.DataFrame()
+
+            if df.empty:
+                return 0
+
+            # Large tables: Arrow's C++ writer serializes straight into
+            # the binary file object when available (utf-8 output only)
+            if (pa_csv is not None and len(df) >= _ARROW_MIN_ROWS
+                    and encoding.lower().replace('-', '') == 'utf8'):
+                if self._arrow_write(df, file_obj, delimiter, header_row):
+                    self.logger.info(f"Streamed {len(df)} rows to CSV")
+                    return len(df)
+
+            # Stream rows through a buffered text wrapper; pandas' own
+            # C writer formats rows without per-cell Python overhead
+            text_wrapper = io.TextIOWrapper(file_obj, encoding=encoding,
+                                            newline='', write_through=False)
+            try:
+                df.to_csv(text_wrapper, sep=delimiter, header=header_row,
+                          index=False, quoting=csv.QUOTE_MINIMAL)
+                rows_written = len(df)
+            finally:
+                # Flush and detach so the caller's file object stays open
+                text_wrapper.flush()
+                text_wrapper.detach()
+
+            self.logger.info(f"Streamed {rows_written} rows to CSV")
+            return rows_written
+
+        except Exception as e:
+            self.logger.error(f"CSV streaming failed: {str(e)}")
+            raise
+
+    def write_rows(self, row_iter, file_obj, **kwargs) -> int:
+        """
+        Write rows from an iterator directly to an open binary file object
+
+        Companion to PDFExtractor.iter_rows: pulls rows one at a time and
+        writes them through a buffered text wrapper, so the full table set
+        never exists in memory at once.
+
+        Args:
+            row_iter: Iterator of row lists (header first, if any)
+            file_obj: Open binary file object to write to
+            **kwargs: Conversion options (delimiter, encoding)
+
+        Returns:
+            Number of rows written (including the header)
+        """
+        try:
+            delimiter = kwargs.get('delimiter', ',')
+            encoding = kwargs.get('encoding', 'utf-8')
+
+            text_wrapper = io.TextIOWrapper(file_obj, encoding=encoding,
+                                            newline='', write_through=False)
+            rows_written = 0
+            try:
+                writer = csv.writer(text_wrapper, delimiter=delimiter,
+                                   quoting=csv.QUOTE_MINIMAL)
+
+                for row in row_iter:
+                    writer.writerow(row)
+                    rows_written += 1
+            finally:
+                text_wrapper.flush()
+                text_wrapper.detach()
+
+            self.logger.info(f"Streamed {rows_written} rows to CSV")
+            return rows_written
+
+        except Exception as e:
+            self.logger.error(f"Row streaming failed: {str(e)}")
+            raise
+
+    def _can_stream_tables(self, tables: List[pd.DataFrame], **kwargs) -> bool:
+        """
+        Whether tables can be serialized without building a merged frame
+
+        Streaming is only equivalent to concat+serialize when no cleaning
+        pass needs to see the merged frame (dedup and empty-row dropping
+        are cross-table) and every table shares the first one's columns.
+        """
+        if kwargs.get('merge_method', 'concat') != 'concat':
+            return False
+        if kwargs.get('clean_data', True) or kwargs.get('skip_empty', True):
+            return False
+
+        first_columns = tables[0].columns
+        return all(table.columns.equals(first_columns) for table in tables[1:])
+
+    def _stream_tables_to_csv(self, tables: List[pd.DataFrame],
+                              delimiter: str = ',', header_row: bool = True) -> str:
+        """
+        Serialize tables into one CSV buffer without concatenating them
+
+        pd.concat copies every block into a fresh frame just so to_csv can
+        walk it once; writing each table into a shared StringIO (header
+        from the first only) halves peak memory on multi-table PDFs.
+        """
+        buf = StringIO()
+
+        tables[0].to_csv(buf, sep=delimiter, index=False, header=header_row,
+                         na_rep='', quoting=csv.QUOTE_MINIMAL)
+        for table in tables[1:]:
+            table.to_csv(buf, sep=delimiter, index=False, header=False,
+                         na_rep='', quoting=csv.QUOTE_MINIMAL)
+
+        return buf.getvalue()
+
+    def _stream_shards_to_csv(self, tables_path: str, text_sink,
+                              delimiter: str = ',', header_row: bool = True) -> int:
+        """
+        Serialize spooled table shards into a text sink, one at a time
+
+        Counterpart to PDFExtractor's stream_to_disk mode: each parquet
+        shard is loaded, written (header from the first only) and
+        released before the next one is read, so peak memory stays
+        proportional to one shard regardless of document size.
+
+        Returns:
+            Number of data rows written
+        """
+        rows_written = 0
+        first = True
+        for shard_df in iter_table_shards(tables_path):
+            shard_df.to_csv(text_sink, sep=delimiter, index=False,
+                            header=header_row and first,
+                            na_rep='', quoting=csv.QUOTE_MINIMAL)
+            rows_written += len(shard_df)
+            first = False
+
+        return rows_written
+
+    def _discard_spool(self, extracted_data: Dict[str, Any]):
+        """
+        Delete a drained shard spool and drop its reference
+
+        The spool only exists to cap extraction memory; once its rows
+        have been streamed out the temp directory would otherwise leak
+        the whole dataset to /tmp on every stream_to_disk run.
+        """
+        tables_path = extracted_data.pop('tables_path', None)
+        if tables_path:
+            shutil.rmtree(tables_path, ignore_errors=True)
+
     def _merge_tables(self, tables: List[pd.DataFrame], **kwargs) -> pd.DataFrame:
         """
         Merge multiple tables into a single DataFrame
@@ -86,7 +396,17 @@ class CSVConverter:
             else:
                 # Default to concatenation
                 merged_df = pd.concat(tables, ignore_index=True, sort=False)
-            
+
+            # Tables from different pages are essentially never row
+            # duplicates of each other, so the dedup hash pass only runs
+            # when asked for - or for small same-shaped table sets where
+            # repeated header rows are a real possibility
+            if 'dedup' not in kwargs:
+                kwargs['dedup'] = (
+                    len(tables) <= 3
+                    and all(table.columns.equals(tables[0].columns)
+                            for table in tables[1:]))
+
             # Clean merged data
             merged_df = self._clean_merged_data(merged_df, **kwargs)
             
@@ -99,98 +419,208 @@ class CSVConverter:
             return tables[0] if tables else pd.DataFrame()
     
     def _union_tables(self, tables: List[pd.DataFrame]) -> pd.DataFrame:
-        """Union tables by aligning columns"""
+        """
+        Union tables by aligning columns
+
+        Fills one preallocated object matrix instead of reindexing every
+        table and concatenating the copies: a reindex-per-table loop
+        allocates a fresh frame per table and concat copies them all a
+        second time, while this does one allocation plus one block copy
+        per table.
+        """
         try:
             if not tables:
                 return pd.DataFrame()
-            
-            # Get all unique columns
-            all_columns = set()
-            for table in tables:
-                all_columns.update(table.columns)
-            
-            all_columns = sorted(list(all_columns))
-            
-            # Align all tables to have same columns
-            aligned_tables = []
+
+            # Fast path: identical column layouts need no union or matrix
+            # fill at all - plain concat keeps dtypes and block layout
+            first_columns = tables[0].columns
+            if all(table.columns.equals(first_columns) for table in tables[1:]):
+                return pd.concat(tables, ignore_index=True, sort=False)
+
+            # Column union memoized on the table-set signature
+            all_columns = list(_union_columns(
+                tuple(tuple(table.columns) for table in tables)))
+
+            col_idx = {column: i for i, column in enumerate(all_columns)}
+            total_rows = sum(len(table) for table in tables)
+
+            out = np.full((total_rows, len(all_columns)), '', dtype=object)
+
+            row_offset = 0
             for table in tables:
-                aligned_table = table.reindex(columns=all_columns, fill_value='')
-                aligned_tables.append(aligned_table)
-            
-            # Concatenate aligned tables
-            merged_df = pd.concat(aligned_tables, ignore_index=True)
-            
-            return merged_df
-            
+                n_rows = len(table)
+                if n_rows:
+                    idx = [col_idx[column] for column in table.columns]
+                    out[row_offset:row_offset + n_rows, idx] = table.to_numpy(dtype=object)
+                row_offset += n_rows
+
+            return pd.DataFrame(out, columns=all_columns)
+
         except Exception as e:
             self.logger.error(f"Table union failed: {str(e)}")
             return pd.concat(tables, ignore_index=True, sort=False)
     
     def _clean_merged_data(self, df: pd.DataFrame, **kwargs) -> pd.DataFrame:
-        """Clean merged DataFrame"""
+        """
+        Clean merged DataFrame
+
+        With defer_na (the default, right for CSV output) empty cells are
+        normalized to '' rather than pd.NA: the CSV writer renders NA as
+        '' anyway, and casting to NA pushes object columns onto pandas'
+        slower ExtensionArray paths for every later op.
+        """
         try:
             clean_data = kwargs.get('clean_data', True)
             skip_empty = kwargs.get('skip_empty', True)
-            
+            defer_na = kwargs.get('defer_na', True)
+            # Direct callers keep the documented clean_data contract
+            # (dedup included); _merge_tables passes its own explicit
+            # decision, since page tables are rarely duplicates
+            dedup = kwargs.get('dedup')
+            if dedup is None:
+                dedup = clean_data
+
             if clean_data:
-                # Remove duplicates
-                df = df.drop_duplicates()
-                
-                # Clean text data
-                for col in df.select_dtypes(include=['object']).columns:
-                    df[col] = df[col].astype(str).str.strip()
-                    df[col] = df[col].replace('nan', '')
-                    df[col] = df[col].replace('', pd.NA)
-            
+                # Clean text data: one list-comprehension pass per object
+                # column instead of the astype/strip/replace chain, which
+                # allocated three intermediate Series per column. The
+                # isinstance fast path covers the common already-string
+                # case; None/NaN and stray scalars are normalized inline
+                # Bound to a plain list once: assigning cleaned columns
+                # back can change their dtype, and the loop must not see
+                # a shifting column set mid-flight
+                obj_cols = list(df.select_dtypes(include=['object']).columns)
+                if obj_cols:
+                    empty = '' if defer_na else pd.NA
+                    drop_values = ('', 'nan', 'None')
+
+                    def _norm(value):
+                        if isinstance(value, str):
+                            value = value.strip()
+                            return empty if value in drop_values else value
+                        if value is None or value != value:
+                            return empty
+                        value = str(value).strip()
+                        return empty if value in drop_values else value
+
+                    for col in obj_cols:
+                        vals = df[col].to_numpy(dtype=object)
+                        df[col] = np.array([_norm(v) for v in vals],
+                                           dtype=object)
+
             if skip_empty:
-                # Remove rows that are completely empty
-                df = df.dropna(how='all')
-            
-            # Reset index
-            df = df.reset_index(drop=True)
-            
+                # Remove rows that are completely empty (JIT-compiled mask
+                # reduction when numba is installed, numpy otherwise).
+                # Runs after cleaning so rows that became all-empty go too
+                empty_mask = df.isna().to_numpy()
+                if defer_na:
+                    empty_mask = empty_mask | df.eq('').to_numpy()
+                empty_mask = np.ascontiguousarray(empty_mask)
+                if empty_mask.size:
+                    df = df[~_fast.empty_rows(empty_mask)]
+
+            if clean_data and dedup:
+                # Dedup last - rows that only differ in whitespace or
+                # 'nan' spelling collapse after normalization; and let
+                # ignore_index rebuild the index in the same pass
+                df = df.drop_duplicates(ignore_index=True)
+            else:
+                df = df.reset_index(drop=True)
+
             return df
             
         except Exception as e:
             self.logger.error(f"Data cleaning failed: {str(e)}")
             return df
     
-    def _dataframe_to_csv(self, df: pd.DataFrame, delimiter: str = ',', 
+    def _arrow_write(self, df: pd.DataFrame, sink, delimiter: str,
+                     header_row: bool) -> bool:
+        """
+        Serialize a frame with Arrow's C++ CSV writer into the given sink
+
+        Arrow scans/quotes cells outside the interpreter and releases the
+        GIL, which pays off on the wide object-dtype tables extraction
+        produces. Returns False (caller falls back to pandas) when the
+        table doesn't convert cleanly.
+        """
+        try:
+            pa_csv.write_csv(
+                pa.Table.from_pandas(df, preserve_index=False),
+                sink,
+                write_options=pa_csv.WriteOptions(
+                    include_header=header_row,
+                    delimiter=delimiter
+                )
+            )
+            return True
+        except Exception as e:
+            self.logger.debug(f"Arrow CSV writer unavailable for this table: {str(e)}")
+            return False
+
+    def _dataframe_to_csv(self, df: pd.DataFrame, delimiter: str = ',',
                          header_row: bool = True) -> str:
         """Convert DataFrame to CSV string"""
         try:
             if df.empty:
                 return ""
-            
-            # Create CSV string
-            output = StringIO()
-            df.to_csv(
-                output,
+
+            # Large tables: use pyarrow's vectorized writer when available
+            if pa_csv is not None and len(df) >= _ARROW_MIN_ROWS:
+                buf = pa.BufferOutputStream()
+                if self._arrow_write(df, buf, delimiter, header_row):
+                    return buf.getvalue().to_pybytes().decode('utf-8')
+
+            # Create CSV string. Purely numeric frames can never need
+            # quoting, so skip the per-cell quote scan for them (unless
+            # the delimiter could collide with numeric literals)
+            quoting = csv.QUOTE_MINIMAL
+            if (delimiter not in '0123456789.+-eE'
+                    and all(pd.api.types.is_numeric_dtype(dtype) for dtype in df.dtypes)
+                    and (not header_row or not any(
+                        isinstance(column, str)
+                        and any(ch in column for ch in (delimiter, '"', '\n', '\r'))
+                        for column in df.columns))):
+                quoting = csv.QUOTE_NONE
+
+            # to_csv returns the string directly when given no buffer -
+            # no StringIO allocation and getvalue copy
+            return df.to_csv(
+                None,
                 sep=delimiter,
                 index=False,
                 header=header_row,
                 na_rep='',
-                quoting=csv.QUOTE_MINIMAL
+                quoting=quoting
             )
-            
-            csv_data = output.getvalue()
-            output.close()
-            
-            return csv_data
-            
+
         except Exception as e:
             self.logger.error(f"DataFrame to CSV conversion failed: {str(e)}")
             raise
     
-    def save_csv(self, csv_data: str, output_path: str, encoding: str = 'utf-8') -> bool:
+    def _dataframe_to_csv_file(self, df: pd.DataFrame, path: str,
+                               delimiter: str = ',', header_row: bool = True,
+                               encoding: str = 'utf-8'):
+        """
+        Write a DataFrame straight to a CSV file
+
+        Streams rows through pandas' buffered file writer instead of
+        materializing the whole CSV string first and writing it in a
+        second pass - one copy of the output in memory instead of two.
+        """
+        df.to_csv(path, sep=delimiter, index=False, header=header_row,
+                  na_rep='', quoting=csv.QUOTE_MINIMAL, encoding=encoding)
+
+    def save_csv(self, csv_data, output_path: str, encoding: str = 'utf-8') -> bool:
         """
         Save CSV data to file
-        
+
         Args:
-            csv_data: CSV data as string
+            csv_data: CSV data as string, or already-encoded bytes
+                (written as-is, no encode)
             output_path: Output file path
-            encoding: File encoding
-            
+            encoding: File encoding (ignored for bytes input)
+
         Returns:
             Success status
         """
@@ -198,16 +628,17 @@ class CSVConverter:
             if not csv_data:
                 self.logger.warning("No CSV data to save")
                 return False
-            
+
             output_path = Path(output_path)
-            
+
             # Create directory if it doesn't exist
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Write CSV data
-            with open(output_path, 'w', encoding=encoding, newline='') as f:
-                f.write(csv_data)
-            
+
+            # Write CSV data in a single large buffered write
+            payload = csv_data if isinstance(csv_data, bytes) else csv_data.encode(encoding)
+            with open(output_path, 'wb', buffering=1 << 20) as f:
+                f.write(payload)
+
             self.logger.info(f"CSV saved successfully: {output_path}")
             return True
             
@@ -240,37 +671,67 @@ class CSVConverter:
             if not tables:
                 return {'csv': False, 'excel': False, 'json': False}
             
-            main_table = tables[0] if len(tables) == 1 else self._merge_tables(tables, **kwargs)
-            
-            # CSV format
-            try:
-                csv_data = self._dataframe_to_csv(main_table, **kwargs)
+            # Only hand merge-relevant options down - export options like
+            # delimiter/encoding have no business in the merge path
+            merge_keys = ('merge_method', 'clean_data', 'skip_empty')
+            merge_kwargs = {k: kwargs[k] for k in merge_keys if k in kwargs}
+            main_table = (tables[0] if len(tables) == 1
+                          else self._merge_tables(tables, **merge_kwargs))
+
+            # CSV format - written straight to disk, no string round-trip
+            def _do_csv():
                 csv_path = output_dir / f"{base_filename}.csv"
-                results['csv'] = self.save_csv(csv_data, str(csv_path), kwargs.get('encoding', 'utf-8'))
-            except Exception as e:
-                self.logger.error(f"CSV export failed: {str(e)}")
-                results['csv'] = False
-            
-            # Excel format
-            try:
+                self._dataframe_to_csv_file(main_table, str(csv_path),
+                                            delimiter=kwargs.get('delimiter', ','),
+                                            header_row=kwargs.get('header_row', True),
+                                            encoding=kwargs.get('encoding', 'utf-8'))
+                self.logger.info(f"CSV saved successfully: {csv_path}")
+
+            # Excel format - xlsxwriter streams rows with bounded memory,
+            # unlike openpyxl which holds the whole workbook
+            def _do_excel():
                 excel_path = output_dir / f"{base_filename}.xlsx"
-                main_table.to_excel(str(excel_path), index=False)
-                results['excel'] = True
+                if _HAS_XLSXWRITER:
+                    with pd.ExcelWriter(
+                            str(excel_path), engine='xlsxwriter',
+                            engine_kwargs={'options': {'constant_memory': True}}) as writer:
+                        main_table.to_excel(writer, index=False)
+                else:
+                    main_table.to_excel(str(excel_path), index=False)
                 self.logger.info(f"Excel saved: {excel_path}")
-            except Exception as e:
-                self.logger.error(f"Excel export failed: {str(e)}")
-                results['excel'] = False
-            
-            # JSON format
-            try:
+
+            # JSON format - long tables default to JSONL: pandas streams
+            # it row-by-row, and indent=2 both doubles the output size
+            # and forces the slow pretty-print path
+            def _do_json():
                 json_path = output_dir / f"{base_filename}.json"
-                main_table.to_json(str(json_path), orient='records', indent=2)
-                results['json'] = True
+                json_format = kwargs.get('json_format')
+                if json_format is None:
+                    json_format = 'jsonl' if len(main_table) > 1000 else 'records'
+
+                if json_format == 'jsonl':
+                    main_table.to_json(str(json_path), orient='records',
+                                       lines=True, force_ascii=False)
+                else:
+                    main_table.to_json(str(json_path), orient='records', indent=2)
                 self.logger.info(f"JSON saved: {json_path}")
-            except Exception as e:
-                self.logger.error(f"JSON export failed: {str(e)}")
-                results['json'] = False
-            
+
+            # The three writers are independent and I/O-bound, so overlap
+            # them - wall time drops toward the slowest (usually Excel).
+            # Failures stay per-format, as in the old sequential flow
+            writers = {'csv': _do_csv, 'excel': _do_excel, 'json': _do_json}
+            with ThreadPoolExecutor(max_workers=len(writers)) as pool:
+                futures = {pool.submit(writer): name
+                           for name, writer in writers.items()}
+                for future in as_completed(futures):
+                    name = futures[future]
+                    try:
+                        future.result()
+                        results[name] = True
+                    except Exception as e:
+                        self.logger.error(f"{name.upper()} export failed: {str(e)}")
+                        results[name] = False
+
             return results
             
         except Exception as e:
@@ -319,56 +780,80 @@ class CSVConverter:
             self.logger.error(f"CSV preview failed: {str(e)}")
             return {'preview': '', 'row_count': 0, 'column_count': 0}
     
-    def validate_csv_data(self, csv_data: str) -> Dict[str, Any]:
+    def validate_csv_data(self, csv_data: str,
+                          df: Optional[pd.DataFrame] = None,
+                          delimiter: str = ',') -> Dict[str, Any]:
         """
         Validate CSV data quality
-        
+
         Args:
             csv_data: CSV data string
-            
+            df: DataFrame the CSV was produced from, if the caller still
+                has it - skips a full re-parse of the output
+            delimiter: Field delimiter the CSV was written with
+
         Returns:
             Validation results
         """
         try:
             if not csv_data:
                 return {'valid': False, 'errors': ['Empty CSV data']}
-            
-            # Try to parse CSV
-            df = pd.read_csv(StringIO(csv_data))
-            
+
             errors = []
             warnings = []
-            
-            # Check for empty DataFrame
-            if df.empty:
+
+            # Gather shape/null stats from the cheapest source available:
+            # the caller's frame, an Arrow probe (multi-threaded parse and
+            # null counts straight off the table, no per-cell Python
+            # objects), or a pandas re-parse as the last resort
+            if df is None and pa_csv is not None:
+                tbl = pa_csv.read_csv(
+                    io.BytesIO(csv_data.encode('utf-8')),
+                    parse_options=pa_csv.ParseOptions(delimiter=delimiter))
+                row_count = tbl.num_rows
+                column_count = tbl.num_columns
+                null_counts = [column.null_count for column in tbl.columns]
+                empty_cols = [name for name, nulls in zip(tbl.column_names, null_counts)
+                              if row_count and nulls == row_count]
+                total_cells = row_count * column_count
+                empty_cells = sum(null_counts)
+            else:
+                if df is None:
+                    df = pd.read_csv(StringIO(csv_data), sep=delimiter)
+                row_count = len(df)
+                column_count = len(df.columns)
+                empty_cols = df.columns[df.isnull().all()].tolist()
+                total_cells = df.size
+                empty_cells = int(df.isnull().sum().sum())
+
+            # Check for empty data
+            if row_count == 0:
                 errors.append("CSV contains no data rows")
-            
+
             # Check for completely empty columns
-            empty_cols = df.columns[df.isnull().all()].tolist()
             if empty_cols:
                 warnings.append(f"Empty columns found: {empty_cols}")
-            
+
             # Check for very sparse data
-            total_cells = df.size
-            empty_cells = df.isnull().sum().sum()
             if total_cells > 0 and (empty_cells / total_cells) > 0.8:
                 warnings.append("Data appears to be very sparse (>80% empty cells)")
             
-            # Check for inconsistent row lengths
+            # Check for inconsistent row lengths: count delimiters per
+            # line in one vectorized C call instead of splitting each line
             lines = csv_data.strip().split('\n')
             if len(lines) > 1:
-                first_row_cols = len(lines[0].split(','))
-                inconsistent_rows = [i for i, line in enumerate(lines[1:], 1) 
-                                   if len(line.split(',')) != first_row_cols]
-                if inconsistent_rows:
-                    warnings.append(f"Inconsistent column count in rows: {inconsistent_rows[:5]}")
+                counts = np.char.count(np.array(lines, dtype=str), delimiter)
+                mismatched = np.nonzero(counts[1:] != counts[0])[0]
+                if mismatched.size:
+                    inconsistent_rows = (mismatched[:5] + 1).tolist()
+                    warnings.append(f"Inconsistent column count in rows: {inconsistent_rows}")
             
             return {
                 'valid': len(errors) == 0,
                 'errors': errors,
                 'warnings': warnings,
-                'row_count': len(df),
-                'column_count': len(df.columns),
+                'row_count': row_count,
+                'column_count': column_count,
                 'empty_cell_percentage': (empty_cells / total_cells * 100) if total_cells > 0 else 0
             }
             
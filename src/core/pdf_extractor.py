@@ -6,36 +6,193 @@ Handles extraction of data from PDF files using multiple methods:
 - Camelot for advanced table detection
 - PyPDF2 for text extraction
 - PDFplumber for complex layouts
+- pypdfium2 (compiled PDFium) for fast text extraction when installed
 """
 
+import functools
+import gc
+import importlib
+import importlib.util
 import logging
+import re
+import numpy as np
+import os
 import pandas as pd
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Any
 import warnings
 
-# PDF processing libraries
-try:
-    import tabula
-except ImportError:
-    tabula = None
+# Heavy PDF backends are imported lazily on first use: importing tabula
+# probes for a JVM and camelot pulls in OpenCV/Ghostscript, which
+# metadata-only callers never need
+tabula = None
+camelot = None
+pdfplumber = None
+pypdfium2 = None
 
-try:
-    import camelot
-except ImportError:
-    camelot = None
+# Sentinel distinguishing "import failed" from "not yet imported", so a
+# missing backend is probed once instead of on every call
+_BACKEND_MISSING = object()
 
-try:
-    import pdfplumber
-except ImportError:
-    pdfplumber = None
+def _backend_available(name: str) -> bool:
+    """Check whether a backend is installed without importing it"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+def _backend_ready(name: str) -> bool:
+    """True when a backend is already imported or known installable"""
+    module = globals().get(name)
+    if module is _BACKEND_MISSING:
+        return False
+    return module is not None or _backend_available(name)
+
+def _load_backend(name: str):
+    """Import a backend module on first use and cache it at module scope"""
+    module = globals().get(name)
+    if module is _BACKEND_MISSING:
+        return None
+    if module is None:
+        try:
+            module = importlib.import_module(name)
+        except ImportError:
+            globals()[name] = _BACKEND_MISSING
+            return None
+        globals()[name] = module
+    return module
 
 import PyPDF2
+from src.core import _fast
 from src.utils.logger import setup_logger
 
 # Suppress warnings for cleaner output
 warnings.filterwarnings('ignore', category=UserWarning)
 
+# Minimum page count before page-parallel extraction is worth the
+# process startup and result-pickling overhead
+_PARALLEL_MIN_PAGES = 8
+
+# "1-5", "-3", "2-end" style range specs; comma lists take the other branch
+_RANGE_RE = re.compile(r'^(\d*)-(\d+|end)$')
+
+# One splitter for every cell delimiter so candidate lines are cut in
+# a single C-level scan instead of branching on the delimiter type.
+# Single tabs split individually - "a\t\tb" must keep its empty cell or
+# tab-separated columns shift left - while space gaps and piped column
+# borders collapse as runs, as the old per-delimiter branches did
+_CELL_SPLIT = re.compile(r'\t|\s{2,}|(?:\s*\|\s*)+')
+
+# Open pdfplumber documents kept per extractor (detect + extract + info
+# on the same file is the common call pattern)
+_PDF_CACHE_SIZE = 4
+
+@functools.lru_cache(maxsize=128)
+def _parse_pages_range(pages_range: str, n_pages: int) -> tuple:
+    """
+    Parse a string pages spec into zero-based page indices
+
+    Handles "1-5", "-3", "2-end" ranges and "1,3,7" comma lists,
+    clamped to the document's page count. Cached because the same spec
+    is re-parsed for every page-by-page call (iter_rows hits this once
+    per page).
+    """
+    match = _RANGE_RE.match(pages_range)
+    if match:
+        start = int(match.group(1)) - 1 if match.group(1) else 0
+        end = n_pages if match.group(2) == 'end' else int(match.group(2))
+        return tuple(range(start, min(end, n_pages)))
+
+    return tuple(int(p) - 1 for p in pages_range.split(',') if int(p) <= n_pages)
+
+def _get_max_workers() -> int:
+    """
+    Default worker count for page-parallel extraction
+
+    sched_getaffinity counts the CPUs this process may actually run
+    on, which respects cgroup/container limits where cpu_count would
+    report the whole machine.
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+def _worker_init():
+    """
+    Pre-import heavy backends once per worker process
+
+    Run as the process-pool initializer so the import cost is paid at
+    worker startup instead of inside the first page-block task.
+    Missing backends are simply skipped.
+    """
+    _load_backend('pdfplumber')
+    _load_backend('pypdfium2')
+
+def _pdfplumber_pages_worker(pdf_path: str, page_indices: List[int]) -> List[list]:
+    """
+    Extract raw tables from a block of pages (runs in a worker process)
+
+    Each worker opens the PDF once so the pdfminer parse cost is
+    amortized over its whole block instead of paid per page. Returns
+    raw cell lists rather than DataFrames to keep pickling cheap.
+    """
+    import pdfplumber as _pdfplumber
+
+    raw_tables = []
+    with _pdfplumber.open(pdf_path) as pdf:
+        for idx in page_indices:
+            for table_data in pdf.pages[idx].extract_tables():
+                if table_data:
+                    raw_tables.append(table_data)
+    return raw_tables
+
+def _pdfium_pages_worker(pdf_path: str, page_indices: List[int]) -> List[str]:
+    """
+    Extract page text from a block of pages with pypdfium2
+
+    Safe for both thread and process pools: each block opens its own
+    document, because a PDFium handle must not be shared across
+    threads even though the library releases the GIL while decoding.
+    """
+    import pypdfium2 as _pdfium
+
+    texts = []
+    pdf = _pdfium.PdfDocument(pdf_path)
+    try:
+        for idx in page_indices:
+            page = pdf[idx]
+            textpage = page.get_textpage()
+            text = textpage.get_text_bounded()
+            textpage.close()
+            page.close()
+
+            if text.strip():
+                texts.append(text)
+    finally:
+        pdf.close()
+    return texts
+
+def iter_table_shards(tables_path: str):
+    """Lazily load spooled table shards back as DataFrames, in order"""
+    for name in sorted(os.listdir(tables_path)):
+        if name.endswith('.parquet'):
+            yield pd.read_parquet(os.path.join(tables_path, name))
+
+def _pypdf2_pages_worker(pdf_path: str, page_indices: List[int]) -> List[str]:
+    """Extract page text from a block of pages (runs in a worker process)"""
+    with open(pdf_path, 'rb') as file:
+        pdf_reader = PyPDF2.PdfReader(file, strict=False)
+        texts = []
+        for idx in page_indices:
+            text = pdf_reader.pages[idx].extract_text()
+            if text.strip():
+                texts.append(text)
+    return texts
+
 class PDFExtractor:
     """Main PDF data extraction class"""
     
@@ -43,15 +200,54 @@ class PDFExtractor:
         """Initialize PDF extractor with configuration"""
         self.config = config_manager
         self.logger = setup_logger(__name__)
+
+        # Honor the config's JIT switch for the shared _fast kernels
+        if config_manager is not None:
+            _fast.set_use_numba(config_manager.get('advanced.use_numba', True))
         
-        # Available extraction methods
+        # Available extraction methods (presence check only - the actual
+        # import is deferred until an extraction method needs the backend)
         self.available_methods = {
-            'tabula': tabula is not None,
-            'camelot': camelot is not None,
-            'pdfplumber': pdfplumber is not None,
+            'tabula': _backend_ready('tabula'),
+            'camelot': _backend_ready('camelot'),
+            'pdfplumber': _backend_ready('pdfplumber'),
+            'pdfium': _backend_ready('pypdfium2'),
             'pypdf2': True  # Always available
         }
         
+        # Build the method dispatch table once instead of re-deciding the
+        # backend on every extract_data call
+        self._method_dispatch = {
+            'tabula': '_extract_with_tabula',
+            'camelot': '_extract_with_camelot',
+            'pdfplumber': '_extract_with_pdfplumber',
+            'pdfium': '_extract_with_pdfium',
+            'pypdf2': '_extract_with_pypdf2'
+        }
+
+        # When the config pins a concrete backend, bake it in so the
+        # per-call auto-detection probe is skipped entirely
+        configured = self.config.get('extraction_method', 'auto') if self.config else 'auto'
+        self._pinned_method = (
+            configured if configured in self._method_dispatch
+            and self.available_methods.get(configured) else None
+        )
+
+        # Small LRU of open pdfplumber documents keyed by (path, mtime)
+        # so repeated detect/extract calls on the same files reuse one
+        # pdfminer parse instead of re-opening. The lock keeps threaded
+        # callers from racing the lookup/insert/evict sequence
+        self._pdf_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # First-page table bounding boxes per (path, page count), used
+        # by the table_template extraction mode for fixed-layout PDFs
+        self._table_templates = {}
+
+        # Page-extraction process pool, created lazily and kept across
+        # extract_data calls so later documents reuse warm workers
+        self._process_pool = None
+
         self.logger.info(f"PDF Extractor initialized. Available methods: {list(k for k, v in self.available_methods.items() if v)}")
     
     def extract_data(self, pdf_path: str, **kwargs) -> Dict[str, Any]:
@@ -60,8 +256,9 @@ class PDFExtractor:
         
         Args:
             pdf_path: Path to PDF file
-            **kwargs: Extraction options (method, pages, pattern, etc.)
-            
+            **kwargs: Extraction options (method, pages, pattern,
+                max_workers for page-parallel extraction, etc.)
+
         Returns:
             Dictionary containing extracted data and metadata
         """
@@ -72,22 +269,24 @@ class PDFExtractor:
             
             self.logger.info(f"Starting extraction from: {pdf_path.name}")
             
-            # Get extraction method
+            # Get extraction method (a config-pinned backend skips
+            # auto-detection entirely)
             method = kwargs.get('method', 'auto')
             if method == 'auto':
-                method = self._detect_best_method(pdf_path)
-            
+                method = self._pinned_method or self._detect_best_method(pdf_path)
+
             # Extract data based on method
-            if method == 'tabula' and self.available_methods['tabula']:
-                extracted_data = self._extract_with_tabula(pdf_path, **kwargs)
-            elif method == 'camelot' and self.available_methods['camelot']:
-                extracted_data = self._extract_with_camelot(pdf_path, **kwargs)
-            elif method == 'pdfplumber' and self.available_methods['pdfplumber']:
-                extracted_data = self._extract_with_pdfplumber(pdf_path, **kwargs)
+            if method in self._method_dispatch and self.available_methods.get(method):
+                extracted_data = getattr(self, self._method_dispatch[method])(pdf_path, **kwargs)
             else:
                 # Fallback to PyPDF2
                 extracted_data = self._extract_with_pypdf2(pdf_path, **kwargs)
             
+            # Callers that merge everything anyway can ask for one
+            # pre-sized frame instead of concatenating downstream
+            if kwargs.get('return_concatenated') and extracted_data.get('tables'):
+                extracted_data['tables'] = [self._concat_tables(extracted_data['tables'])]
+
             # Add metadata
             extracted_data.update({
                 'source_file': str(pdf_path),
@@ -102,42 +301,327 @@ class PDFExtractor:
             self.logger.error(f"Extraction failed: {str(e)}")
             raise
     
-    def _detect_best_method(self, pdf_path: Path) -> str:
+    def iter_rows(self, pdf_path: str, **kwargs):
         """
-        Auto-detect the best extraction method for the PDF
-        
+        Stream table rows from a PDF page by page
+
+        Yields the header row of the first table found, then data rows
+        from every table, keeping at most one page of tables in memory.
+        Designed to feed CSVConverter.write_rows so extract, convert and
+        save become a single streaming pass.
+
         Args:
             pdf_path: Path to PDF file
-            
+            **kwargs: Extraction options passed through to extract_data
+
+        Yields:
+            Lists of cell values, header first
+        """
+        info = self.get_pdf_info(pdf_path, metadata_only=True)
+        total_pages = info.get('total_pages', 0) or 1
+
+        kwargs.pop('pages', None)
+        header_emitted = False
+
+        for page_num in range(1, total_pages + 1):
+            result = self.extract_data(pdf_path, pages=str(page_num), **kwargs)
+
+            for table in result.get('tables', []):
+                if not header_emitted:
+                    yield [str(col) for col in table.columns]
+                    header_emitted = True
+
+                for row in table.itertuples(index=False, name=None):
+                    yield list(row)
+
+    def extract_data_parallel(self, pdf_path: str, workers: int = 4, **kwargs) -> Dict[str, Any]:
+        """
+        Extract data from a large PDF by sharding pages across threads
+
+        Splits the document into one page range per worker and runs
+        extract_data on each range concurrently. Threads are sufficient
+        here because the tabula/camelot backends do their heavy lifting
+        outside the GIL (subprocess/JPype).
+
+        Args:
+            pdf_path: Path to PDF file
+            workers: Number of concurrent page-range shards
+            **kwargs: Extraction options passed through to extract_data
+
         Returns:
-            Best method name
+            Dictionary containing merged extracted data and metadata
         """
         try:
-            # Try to detect tables first
-            if self.available_methods['tabula']:
-                # Quick test with tabula
+            from concurrent.futures import ThreadPoolExecutor
+
+            info = self.get_pdf_info(pdf_path)
+            total_pages = info.get('total_pages', 0)
+
+            # Not worth sharding tiny documents
+            if total_pages <= workers or workers <= 1:
+                return self.extract_data(pdf_path, **kwargs)
+
+            # Split into contiguous page ranges, one per worker
+            chunk = -(-total_pages // workers)  # ceil division
+            ranges = [f"{lo}-{min(lo + chunk - 1, total_pages)}"
+                      for lo in range(1, total_pages + 1, chunk)]
+
+            self.logger.info(f"Parallel extraction across {len(ranges)} page ranges")
+
+            kwargs.pop('pages', None)
+
+            # Resolve the backend once up front and make the shards
+            # bypass the shared document cache: detection and cached
+            # pdfplumber documents are not safe to touch from multiple
+            # threads, so each shard opens its own document instead
+            method = kwargs.pop('method', 'auto')
+            if method == 'auto':
+                method = self._pinned_method or self._detect_best_method(Path(pdf_path))
+            kwargs['use_doc_cache'] = False
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(
+                    lambda pages: self.extract_data(pdf_path, pages=pages,
+                                                    method=method, **kwargs),
+                    ranges
+                ))
+
+            # Merge per-range results in page order
+            tables = []
+            for result in results:
+                tables.extend(result.get('tables', []))
+
+            return {
+                'tables': tables,
+                'total_rows': sum(len(table) for table in tables),
+                'total_columns': max((len(table.columns) for table in tables), default=0),
+                'method': results[0].get('method', 'auto') if results else 'auto',
+                'source_file': str(pdf_path),
+                'extraction_method': results[0].get('extraction_method', 'auto') if results else 'auto',
+                'pages_processed': 'all'
+            }
+
+        except Exception as e:
+            self.logger.error(f"Parallel extraction failed: {str(e)}")
+            raise
+
+    def _resolve_page_indices(self, pdf_path: Path, pages_range,
+                              total: Optional[int] = None) -> List[int]:
+        """
+        Resolve a pages spec to zero-based page indices without opening
+        a backend
+
+        Args:
+            pdf_path: Path to PDF file
+            pages_range: "1-5" / "1,3,7" / parsed sequence / None for all
+            total: Page count when the caller already knows it (skips
+                the metadata read)
+
+        Returns:
+            List of zero-based page indices in document order
+        """
+        if total is None:
+            total = self.get_pdf_info(pdf_path, metadata_only=True).get('total_pages', 0)
+
+        if not pages_range:
+            return list(range(total))
+
+        if isinstance(pages_range, str):
+            return list(_parse_pages_range(pages_range, total))
+
+        # Already a parsed sequence of page numbers
+        return [p - 1 for p in pages_range if 0 < p <= total]
+
+    def _map_page_blocks(self, worker, pdf_path: Path, page_indices: List[int],
+                         max_workers: int, use_threads: bool = False) -> list:
+        """
+        Run a page-block worker function across workers
+
+        Pages are split into one contiguous block per worker (block
+        granularity amortizes the per-worker PDF open cost) and the
+        per-block results are concatenated in block order, so page
+        order is preserved. Backends that release the GIL during
+        native decoding can ask for threads instead of processes and
+        skip the pickling and startup cost.
+
+        Args:
+            worker: Module-level picklable function (pdf_path, indices)
+            pdf_path: Path to PDF file
+            page_indices: Zero-based page indices to process
+            max_workers: Upper bound on concurrent workers
+            use_threads: Run blocks on threads instead of processes
+
+        Returns:
+            Flat list of per-page results in page order
+        """
+        n_blocks = min(max_workers, len(page_indices))
+        block = -(-len(page_indices) // n_blocks)  # ceil division
+        blocks = [page_indices[i:i + block]
+                  for i in range(0, len(page_indices), block)]
+
+        self.logger.debug(f"Page-parallel extraction: {len(blocks)} blocks of ~{block} pages")
+
+        if use_threads:
+            with ThreadPoolExecutor(max_workers=n_blocks) as executor:
+                results = list(executor.map(worker, [str(pdf_path)] * len(blocks), blocks))
+        else:
+            executor = self._get_process_pool()
+            results = list(executor.map(worker, [str(pdf_path)] * len(blocks), blocks))
+
+        merged = []
+        for result in results:
+            merged.extend(result)
+
+        return merged
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """
+        Lazily create and reuse the page-extraction process pool
+
+        Sized to the CPUs this process may run on and warm-started via
+        the _worker_init initializer, so the per-worker backend import
+        cost is paid once per pool lifetime, not once per document.
+        Workers are only actually spawned as tasks demand them.
+        """
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=_get_max_workers(), initializer=_worker_init)
+        return self._process_pool
+
+    def _concat_tables(self, tables: List[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Concatenate extracted tables through one preallocated matrix
+
+        The shapes are known up front, so the output buffer is
+        allocated once at its final size and filled slice by slice -
+        no repeated pandas reallocation the way incremental concat
+        does. Tables are aligned by position; narrower tables leave
+        empty cells, and the widest table donates the column names.
+
+        Args:
+            tables: Non-empty list of extracted DataFrames
+
+        Returns:
+            Single DataFrame with all rows in extraction order
+        """
+        total_rows = sum(len(table) for table in tables)
+        widest = max(tables, key=lambda table: len(table.columns))
+        max_columns = len(widest.columns)
+
+        out = np.full((total_rows, max_columns), '', dtype=object)
+
+        row_offset = 0
+        for table in tables:
+            out[row_offset:row_offset + len(table), :len(table.columns)] = \
+                table.to_numpy(dtype=object)
+            row_offset += len(table)
+
+        return pd.DataFrame(out, columns=list(widest.columns))
+
+    def _flush_table_shard(self, tables: List[pd.DataFrame], spool_dir: str,
+                           shard: int) -> int:
+        """
+        Write accumulated tables to a parquet shard and bump the index
+
+        Part of the streaming extraction path: flushing every chunk
+        keeps peak memory proportional to the chunk instead of the
+        whole document.
+        """
+        pd.concat(tables, ignore_index=True, sort=False).to_parquet(
+            os.path.join(spool_dir, f"chunk_{shard:05d}.parquet"))
+        return shard + 1
+
+    def _open_pdfplumber(self, pdf_path: Path):
+        """
+        Open a PDF with pdfplumber through the per-extractor LRU cache
+
+        Documents are keyed by path and mtime so the detection probe
+        and subsequent extractions share a single pdfminer parse. The
+        least recently used document is closed once more than
+        _PDF_CACHE_SIZE files are open.
+        """
+        pdfplumber = _load_backend('pdfplumber')
+
+        key = (str(pdf_path), Path(pdf_path).stat().st_mtime)
+        with self._cache_lock:
+            pdf = self._pdf_cache.get(key)
+            if pdf is not None:
+                self._pdf_cache.move_to_end(key)
+                return pdf
+
+            pdf = pdfplumber.open(str(pdf_path))
+            self._pdf_cache[key] = pdf
+
+            if len(self._pdf_cache) > _PDF_CACHE_SIZE:
+                _, evicted = self._pdf_cache.popitem(last=False)
                 try:
-                    test_tables = tabula.read_pdf(str(pdf_path), pages=1, silent=True, lattice=True)
-                    if test_tables and len(test_tables) > 0 and not test_tables[0].empty:
-                        return 'tabula'
-                except:
+                    evicted.close()
+                except Exception:
                     pass
-            
-            if self.available_methods['camelot']:
-                # Test with camelot
+
+        return pdf
+
+    def close(self):
+        """Close cached pdfplumber documents and shut the worker pool down"""
+        with self._cache_lock:
+            while self._pdf_cache:
+                _, pdf = self._pdf_cache.popitem()
                 try:
-                    test_tables = camelot.read_pdf(str(pdf_path), pages='1')
-                    if test_tables and len(test_tables) > 0:
-                        return 'camelot'
-                except:
+                    pdf.close()
+                except Exception:
                     pass
-            
+
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
+
+    def _detect_best_method(self, pdf_path: Path) -> str:
+        """
+        Auto-detect the best extraction method for the PDF
+
+        A single pdfplumber open of page 1 decides the method from the
+        page geometry (ruling lines mean lattice-friendly tables)
+        instead of running full tabula/camelot probe extractions, and
+        the opened document is kept for _extract_with_pdfplumber to
+        reuse so the file is parsed once, not three times.
+
+        Args:
+            pdf_path: Path to PDF file
+
+        Returns:
+            Best method name
+        """
+        try:
             if self.available_methods['pdfplumber']:
-                return 'pdfplumber'
-            
-            # Fallback to PyPDF2
-            return 'pypdf2'
-            
+                pdf = self._open_pdfplumber(pdf_path)
+                page = pdf.pages[0]
+
+                has_tables = bool(page.find_tables())
+                ruling_lines = len(page.rects) + len(page.lines)
+
+                if has_tables and ruling_lines > 0:
+                    # Ruled grid - lattice-mode backends are most reliable
+                    if self.available_methods['tabula']:
+                        return 'tabula'
+                    if self.available_methods['camelot']:
+                        return 'camelot'
+
+                if has_tables:
+                    return 'pdfplumber'
+
+                # No detectable table structure - plain text fallback,
+                # preferring the compiled PDFium binding when installed
+                return 'pdfium' if self.available_methods.get('pdfium') else 'pypdf2'
+
+            # Without pdfplumber there is nothing cheap to probe with -
+            # fall back in preference order
+            if self.available_methods['tabula']:
+                return 'tabula'
+            if self.available_methods['camelot']:
+                return 'camelot'
+
+            return 'pdfium' if self.available_methods.get('pdfium') else 'pypdf2'
+
         except Exception as e:
             self.logger.warning(f"Method detection failed, using PyPDF2: {str(e)}")
             return 'pypdf2'
@@ -145,20 +629,44 @@ class PDFExtractor:
     def _extract_with_tabula(self, pdf_path: Path, **kwargs) -> Dict[str, Any]:
         """Extract data using tabula-py"""
         try:
-            pages = kwargs.get('pages', 'all')
+            tabula = _load_backend('tabula')
+            pages = kwargs.get('pages') or 'all'
             lattice = kwargs.get('lattice', True)
-            
+            max_workers = kwargs.get('max_workers') or 1
+
+            # Pre-parsed page sequences go to tabula as a list of ints
+            if not isinstance(pages, str):
+                pages = list(pages)
+
             self.logger.debug(f"Using tabula extraction on pages: {pages}")
-            
-            # Extract tables
-            dfs = tabula.read_pdf(
-                str(pdf_path),
-                pages=pages,
-                lattice=lattice,
-                stream=not lattice,
-                guess=True,
-                silent=True
-            )
+
+            def _read(page_spec):
+                return tabula.read_pdf(
+                    str(pdf_path),
+                    pages=page_spec,
+                    lattice=lattice,
+                    stream=not lattice,
+                    guess=True,
+                    silent=True
+                )
+
+            # Whole-document extraction can be sharded into page ranges
+            # run on threads: each range is its own Java subprocess, and
+            # splitting overlaps their startup and parsing
+            total = 0
+            if max_workers > 1 and pages == 'all':
+                total = self.get_pdf_info(pdf_path, metadata_only=True).get('total_pages', 0)
+
+            if total >= _PARALLEL_MIN_PAGES:
+                chunk = -(-total // max_workers)  # ceil division
+                ranges = [f"{lo}-{min(lo + chunk - 1, total)}"
+                          for lo in range(1, total + 1, chunk)]
+
+                with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                    dfs = [df for result in executor.map(_read, ranges)
+                           for df in result]
+            else:
+                dfs = _read(pages)
             
             if not dfs:
                 return {'tables': [], 'total_rows': 0, 'total_columns': 0, 'method': 'tabula'}
@@ -191,8 +699,15 @@ class PDFExtractor:
     def _extract_with_camelot(self, pdf_path: Path, **kwargs) -> Dict[str, Any]:
         """Extract data using camelot-py"""
         try:
-            pages = kwargs.get('pages', '1-end')
+            camelot = _load_backend('camelot')
+            pages = kwargs.get('pages') or '1-end'
             flavor = kwargs.get('flavor', 'lattice')
+            stream_to_disk = kwargs.get('stream_to_disk', False)
+            chunk_size = kwargs.get('chunk_size', 50)
+
+            # Camelot only takes string specs - join pre-parsed sequences
+            if not isinstance(pages, str):
+                pages = ','.join(str(p) for p in pages)
             
             self.logger.debug(f"Using camelot extraction with flavor: {flavor}")
             
@@ -211,7 +726,11 @@ class PDFExtractor:
             total_rows = 0
             max_columns = 0
             
-            for table in tables_obj:
+            if stream_to_disk:
+                spool_dir = tempfile.mkdtemp(prefix='pdf2csv_tables_')
+                shard = 0
+
+            for table_num, table in enumerate(tables_obj, 1):
                 df = table.df
                 if df is not None and not df.empty:
                     # Clean the dataframe
@@ -219,14 +738,41 @@ class PDFExtractor:
                     tables.append(df)
                     total_rows += len(df)
                     max_columns = max(max_columns, len(df.columns))
-            
+
+                if stream_to_disk:
+                    # Lattice tables keep an uncompressed page image
+                    # alive - drop it as soon as the cells are out
+                    if hasattr(table, '_image'):
+                        table._image = None
+
+                    if table_num % chunk_size == 0 and tables:
+                        shard = self._flush_table_shard(tables, spool_dir, shard)
+                        tables = []
+                        gc.collect()
+
+            accuracy = sum(table.accuracy for table in tables_obj) / len(tables_obj) if tables_obj else 0
+
+            if stream_to_disk:
+                if tables:
+                    self._flush_table_shard(tables, spool_dir, shard)
+
+                return {
+                    'tables': [],
+                    'tables_path': spool_dir,
+                    'total_rows': total_rows,
+                    'total_columns': max_columns,
+                    'method': 'camelot',
+                    'pages': pages,
+                    'accuracy': accuracy
+                }
+
             return {
                 'tables': tables,
                 'total_rows': total_rows,
                 'total_columns': max_columns,
                 'method': 'camelot',
                 'pages': pages,
-                'accuracy': sum(table.accuracy for table in tables_obj) / len(tables_obj) if tables_obj else 0
+                'accuracy': accuracy
             }
             
         except Exception as e:
@@ -237,43 +783,125 @@ class PDFExtractor:
         """Extract data using pdfplumber"""
         try:
             pages_range = kwargs.get('pages')
-            
+            max_workers = kwargs.get('max_workers') or 1
+            stream_to_disk = kwargs.get('stream_to_disk', False)
+            chunk_size = kwargs.get('chunk_size', 50)
+
             self.logger.debug("Using pdfplumber extraction")
-            
+
             tables = []
             total_rows = 0
             max_columns = 0
-            
-            with pdfplumber.open(str(pdf_path)) as pdf:
+
+            # Page-parallel path: shard pages across worker processes,
+            # each opening the PDF once for its block
+            if max_workers > 1:
+                page_indices = self._resolve_page_indices(pdf_path, pages_range)
+                if len(page_indices) >= _PARALLEL_MIN_PAGES:
+                    raw_tables = self._map_page_blocks(
+                        _pdfplumber_pages_worker, pdf_path, page_indices, max_workers)
+
+                    for table_data in raw_tables:
+                        df = pd.DataFrame(table_data[1:], columns=table_data[0])
+                        df = self._clean_dataframe(df)
+
+                        if not df.empty:
+                            tables.append(df)
+                            total_rows += len(df)
+                            max_columns = max(max_columns, len(df.columns))
+
+                    return {
+                        'tables': tables,
+                        'total_rows': total_rows,
+                        'total_columns': max_columns,
+                        'method': 'pdfplumber',
+                        'pages': pages_range or 'all'
+                    }
+
+            # Reuses the document opened by the detection probe when
+            # the path and mtime still match. Thread shards must opt
+            # out: pdfplumber documents share one seekable stream and
+            # are not thread-safe, and LRU eviction could close a
+            # document another thread is still reading
+            use_doc_cache = kwargs.get('use_doc_cache', True)
+            if use_doc_cache:
+                pdf = self._open_pdfplumber(pdf_path)
+            else:
+                pdfplumber = _load_backend('pdfplumber')
+                pdf = pdfplumber.open(str(pdf_path))
+
+            try:
                 pages_to_process = pdf.pages
-                
+
                 # Handle page range
                 if pages_range:
-                    if isinstance(pages_range, str):
-                        if '-' in pages_range:
-                            start, end = pages_range.split('-')
-                            start = int(start) - 1 if start else 0
-                            end = int(end) if end != 'end' else len(pdf.pages)
-                            pages_to_process = pdf.pages[start:end]
-                        else:
-                            page_nums = [int(p) - 1 for p in pages_range.split(',')]
-                            pages_to_process = [pdf.pages[i] for i in page_nums if i < len(pdf.pages)]
-                
-                for page in pages_to_process:
+                    pages_to_process = [
+                        pdf.pages[i] for i in self._resolve_page_indices(
+                            pdf_path, pages_range, total=len(pdf.pages))
+                    ]
+
+                # Fixed-layout documents can skip per-page table detection:
+                # detect once on the first page, then crop every page to the
+                # same bounding boxes
+                bboxes = None
+                if kwargs.get('table_template') == 'auto-first-page' and pages_to_process:
+                    template_key = (str(pdf_path), len(pdf.pages))
+                    bboxes = self._table_templates.get(template_key)
+                    if bboxes is None:
+                        bboxes = [found.bbox for found in pages_to_process[0].find_tables()]
+                        self._table_templates[template_key] = bboxes
+
+                if stream_to_disk:
+                    spool_dir = tempfile.mkdtemp(prefix='pdf2csv_tables_')
+                    shard = 0
+
+                for page_num, page in enumerate(pages_to_process, 1):
                     # Extract tables from page
-                    page_tables = page.extract_tables()
-                    
+                    if bboxes:
+                        page_tables = [table_data for table_data in
+                                       (page.crop(bbox).extract_table() for bbox in bboxes)
+                                       if table_data]
+                        if not page_tables:
+                            # Layout changed on this page - fall back to
+                            # full detection rather than dropping its data
+                            page_tables = page.extract_tables()
+                    else:
+                        page_tables = page.extract_tables()
+
                     for table_data in page_tables:
                         if table_data:
                             # Convert to DataFrame
                             df = pd.DataFrame(table_data[1:], columns=table_data[0])
                             df = self._clean_dataframe(df)
-                            
+
                             if not df.empty:
                                 tables.append(df)
                                 total_rows += len(df)
                                 max_columns = max(max_columns, len(df.columns))
-            
+
+                    # Spool to disk every chunk_size pages so only one
+                    # chunk of tables is ever resident
+                    if stream_to_disk and page_num % chunk_size == 0 and tables:
+                        shard = self._flush_table_shard(tables, spool_dir, shard)
+                        tables = []
+                        gc.collect()
+            finally:
+                if not use_doc_cache:
+                    pdf.close()
+
+            if stream_to_disk:
+                if tables:
+                    self._flush_table_shard(tables, spool_dir, shard)
+
+                return {
+                    'tables': [],
+                    'tables_path': spool_dir,
+                    'total_rows': total_rows,
+                    'total_columns': max_columns,
+                    'method': 'pdfplumber',
+                    'pages': pages_range or 'all'
+                }
+
             return {
                 'tables': tables,
                 'total_rows': total_rows,
@@ -286,31 +914,98 @@ class PDFExtractor:
             self.logger.error(f"PDFplumber extraction failed: {str(e)}")
             raise
     
+    def _extract_with_pdfium(self, pdf_path: Path, **kwargs) -> Dict[str, Any]:
+        """
+        Extract text data using pypdfium2
+
+        Same text-to-table pipeline as the PyPDF2 fallback, but the
+        page decoding runs inside Google's compiled PDFium library
+        instead of the Python interpreter, which is typically an order
+        of magnitude faster on multi-hundred-page documents.
+        """
+        try:
+            pdfium = _load_backend('pypdfium2')
+
+            self.logger.debug("Using pdfium text extraction")
+
+            max_workers = kwargs.get('max_workers') or 1
+
+            pdf = pdfium.PdfDocument(str(pdf_path))
+            try:
+                page_indices = self._resolve_page_indices(
+                    pdf_path, kwargs.get('pages'), total=len(pdf))
+
+                if max_workers > 1 and len(page_indices) >= _PARALLEL_MIN_PAGES:
+                    # PDFium releases the GIL while decoding, so thread
+                    # blocks scale without process startup or pickling
+                    text_content = self._map_page_blocks(
+                        _pdfium_pages_worker, pdf_path, page_indices,
+                        max_workers, use_threads=True)
+                else:
+                    text_content = []
+                    for idx in page_indices:
+                        page = pdf[idx]
+                        textpage = page.get_textpage()
+                        text = textpage.get_text_bounded()
+                        textpage.close()
+                        page.close()
+
+                        if text.strip():
+                            text_content.append(text)
+            finally:
+                pdf.close()
+
+            # Try to parse text into structured data
+            parsed_data = self._parse_text_to_table(text_content)
+
+            return {
+                'tables': parsed_data,
+                'total_rows': sum(len(table) for table in parsed_data),
+                'total_columns': max((len(table.columns) for table in parsed_data), default=0),
+                'method': 'pdfium',
+                'raw_text': text_content
+            }
+
+        except Exception as e:
+            self.logger.error(f"pdfium extraction failed: {str(e)}")
+            raise
+
     def _extract_with_pypdf2(self, pdf_path: Path, **kwargs) -> Dict[str, Any]:
         """Extract text data using PyPDF2 (fallback method)"""
         try:
             self.logger.debug("Using PyPDF2 text extraction (fallback method)")
-            
+
+            max_workers = kwargs.get('max_workers') or 1
+
+            # Page-parallel path: shard pages across worker processes
+            if max_workers > 1:
+                page_indices = self._resolve_page_indices(pdf_path, kwargs.get('pages'))
+                if len(page_indices) >= _PARALLEL_MIN_PAGES:
+                    text_content = self._map_page_blocks(
+                        _pypdf2_pages_worker, pdf_path, page_indices, max_workers)
+                    parsed_data = self._parse_text_to_table(text_content)
+
+                    return {
+                        'tables': parsed_data,
+                        'total_rows': sum(len(table) for table in parsed_data),
+                        'total_columns': max((len(table.columns) for table in parsed_data), default=0),
+                        'method': 'pypdf2',
+                        'raw_text': text_content
+                    }
+
             text_content = []
-            
+
             with open(pdf_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
                 
                 pages_range = kwargs.get('pages')
                 pages_to_process = range(len(pdf_reader.pages))
-                
+
                 # Handle page range
                 if pages_range:
-                    if isinstance(pages_range, str):
-                        if '-' in pages_range:
-                            start, end = pages_range.split('-')
-                            start = int(start) - 1 if start else 0
-                            end = int(end) if end != 'end' else len(pdf_reader.pages)
-                            pages_to_process = range(start, min(end, len(pdf_reader.pages)))
-                        else:
-                            page_nums = [int(p) - 1 for p in pages_range.split(',')]
-                            pages_to_process = [i for i in page_nums if i < len(pdf_reader.pages)]
-                
+                    pages_to_process = self._resolve_page_indices(
+                        pdf_path, pages_range, total=len(pdf_reader.pages))
+
                 for page_num in pages_to_process:
                     page = pdf_reader.pages[page_num]
                     text = page.extract_text()
@@ -337,16 +1032,20 @@ class PDFExtractor:
         try:
             # Remove completely empty rows and columns
             df = df.dropna(how='all').dropna(axis=1, how='all')
-            
-            # Clean column names
-            df.columns = [str(col).strip() for col in df.columns]
-            
-            # Clean cell values
-            for col in df.columns:
-                if df[col].dtype == 'object':
-                    df[col] = df[col].astype(str).str.strip()
-                    df[col] = df[col].replace('nan', '')
-            
+
+            # Clean column names (vectorized Index op)
+            df.columns = df.columns.astype(str).str.strip()
+
+            # Clean cell values: one pass over the whole string-typed
+            # block instead of a Python loop per column
+            str_cols = df.select_dtypes(include=['object', 'string']).columns
+            if len(str_cols):
+                df[str_cols] = (
+                    df[str_cols].fillna('').astype(str)
+                    .apply(lambda s: s.str.strip())
+                    .replace({'nan': '', 'None': '', 'NaN': ''})
+                )
+
             # Reset index
             df = df.reset_index(drop=True)
             
@@ -360,45 +1059,53 @@ class PDFExtractor:
         """Try to parse raw text into tabular data"""
         try:
             tables = []
-            
+
             for text in text_content:
-                lines = text.split('\n')
-                
-                # Look for patterns that might be tabular
+                # Classify every line in one numeric pass over the raw
+                # byte buffer (JIT-compiled when numba is available), so
+                # only candidate tabular lines are decoded and split
+                data = text.encode('utf-8')
+                buf = np.frombuffer(data, dtype=np.uint8)
+                starts, ends = _fast.find_line_offsets(buf)
+                codes = _fast.classify_lines(buf, starts, ends)
+
                 potential_rows = []
-                for line in lines:
-                    line = line.strip()
-                    if line and ('\t' in line or '  ' in line or '|' in line):
-                        # Split by common delimiters
-                        if '\t' in line:
-                            cells = line.split('\t')
-                        elif '|' in line:
-                            cells = [cell.strip() for cell in line.split('|') if cell.strip()]
-                        else:
-                            # Split by multiple spaces
-                            cells = [cell.strip() for cell in line.split('  ') if cell.strip()]
-                        
-                        if len(cells) > 1:
-                            potential_rows.append(cells)
+                for i in np.nonzero(codes)[0]:
+                    line = data[starts[i]:ends[i]].decode('utf-8').strip()
+
+                    # One regex pass cuts the line regardless of which
+                    # delimiter the classification found. Interior
+                    # empty cells are real data (consecutive tabs);
+                    # only boundary empties - leading/trailing pipes -
+                    # get trimmed
+                    cells = _CELL_SPLIT.split(line)
+                    while cells and not cells[0]:
+                        cells.pop(0)
+                    while cells and not cells[-1]:
+                        cells.pop()
+
+                    if len(cells) > 1:
+                        potential_rows.append(cells)
                 
                 if potential_rows:
                     # Find consistent column count
                     max_cols = max(len(row) for row in potential_rows)
                     consistent_rows = [row for row in potential_rows if len(row) >= max_cols // 2]
-                    
-                    if consistent_rows:
-                        # Pad rows to same length
-                        padded_rows = []
-                        for row in consistent_rows:
-                            padded_row = row + [''] * (max_cols - len(row))
-                            padded_rows.append(padded_row[:max_cols])
-                        
-                        # Create DataFrame
-                        if len(padded_rows) > 1:
-                            df = pd.DataFrame(padded_rows[1:], columns=padded_rows[0])
-                            df = self._clean_dataframe(df)
-                            if not df.empty:
-                                tables.append(df)
+
+                    if len(consistent_rows) > 1:
+                        # Preallocate one object matrix and fill it row
+                        # by row: padding comes free from np.full and
+                        # pandas takes the array in a single C-level
+                        # copy instead of inferring cell types over a
+                        # list of lists
+                        arr = np.full((len(consistent_rows), max_cols), '', dtype=object)
+                        for i, row in enumerate(consistent_rows):
+                            arr[i, :len(row)] = row
+
+                        df = pd.DataFrame(arr[1:], columns=arr[0].tolist())
+                        df = self._clean_dataframe(df)
+                        if not df.empty:
+                            tables.append(df)
             
             return tables
             
@@ -406,44 +1113,82 @@ class PDFExtractor:
             self.logger.warning(f"Text parsing failed: {str(e)}")
             return []
     
-    def get_pdf_info(self, pdf_path: str) -> Dict[str, Any]:
-        """Get basic information about the PDF file"""
+    def get_pdf_info(self, pdf: Union[str, Path, PyPDF2.PdfReader],
+                     metadata_only: bool = False) -> Dict[str, Any]:
+        """
+        Get basic information about the PDF file
+
+        Args:
+            pdf: Path to PDF file, or an already-open PdfReader to reuse
+                (avoids re-opening the file and re-parsing the xref table)
+            metadata_only: Read only the document metadata and page count
+                without touching page content streams (fast path for
+                listing many files)
+
+        Returns:
+            Dictionary with PDF information
+        """
         try:
-            pdf_path = Path(pdf_path)
-            
+            if not isinstance(pdf, (str, Path)):
+                # Reuse the caller's reader - no re-open, no xref re-parse
+                stream_name = getattr(pdf.stream, 'name', '')
+                info = {
+                    'filename': Path(stream_name).name if stream_name else '',
+                    'total_pages': len(pdf.pages),
+                    'metadata': pdf.metadata if pdf.metadata else {}
+                }
+
+                if not metadata_only and stream_name:
+                    info['file_size'] = Path(stream_name).stat().st_size
+
+                return info
+
+            pdf_path = Path(pdf)
+
             with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                
+                pdf_reader = PyPDF2.PdfReader(file, strict=False)
+
                 info = {
                     'filename': pdf_path.name,
                     'total_pages': len(pdf_reader.pages),
-                    'file_size': pdf_path.stat().st_size,
                     'metadata': pdf_reader.metadata if pdf_reader.metadata else {}
                 }
-                
+
+                if not metadata_only:
+                    info['file_size'] = pdf_path.stat().st_size
+
                 return info
-                
+
         except Exception as e:
             self.logger.error(f"Failed to get PDF info: {str(e)}")
             return {}
-    
-    def validate_pdf(self, pdf_path: str) -> bool:
-        """Validate if file is a readable PDF"""
+
+    def validate_pdf(self, pdf: Union[str, Path, PyPDF2.PdfReader]) -> bool:
+        """
+        Validate if file is a readable PDF
+
+        Accepts either a path or an already-open PdfReader so callers
+        that go on to extract data can open the file once and reuse it.
+        """
         try:
-            pdf_path = Path(pdf_path)
-            
+            if not isinstance(pdf, (str, Path)):
+                # Already parsed - just confirm there are pages
+                return len(pdf.pages) > 0
+
+            pdf_path = Path(pdf)
+
             if not pdf_path.exists():
                 return False
-            
+
             if pdf_path.suffix.lower() != '.pdf':
                 return False
-            
+
             # Try to open with PyPDF2
             with open(pdf_path, 'rb') as file:
                 PyPDF2.PdfReader(file)
-            
+
             return True
-            
+
         except Exception as e:
             self.logger.error(f"PDF validation failed: {str(e)}")
             return False
\ No newline at end of file
@@ -2,7 +2,9 @@
 File handling utilities for PDF to CSV processor
 """
 
+import functools
 import os
+import re
 import shutil
 from pathlib import Path
 from typing import List, Dict, Any, Optional
@@ -12,6 +14,27 @@ import pandas as pd
 
 from src.utils.logger import setup_logger
 
+# Compiled once at module load so per-file sanitization does not rely on
+# the bounded (and evictable) re module pattern cache
+_INVALID_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+
+@functools.lru_cache(maxsize=4096)
+def _safe_filename(filename: str, max_length: int) -> str:
+    """Pure, memoized core of get_safe_filename"""
+    # Remove invalid characters
+    safe_name = _INVALID_CHARS_RE.sub('', filename)
+
+    # Replace spaces with underscores
+    safe_name = safe_name.replace(' ', '_')
+
+    # Limit length
+    if len(safe_name) > max_length:
+        name_part = safe_name[:max_length-10]  # Leave room for extension
+        extension = Path(safe_name).suffix
+        safe_name = name_part + extension
+
+    return safe_name
+
 class FileHandler:
     """Handles file operations for PDF processing"""
     
@@ -35,51 +58,73 @@ class FileHandler:
         """
         try:
             file_path = Path(file_path)
-            
-            # Check if file exists
-            if not file_path.exists():
-                self.logger.error(f"File does not exist: {file_path}")
-                return False
-            
+
             # Check file extension
             if file_path.suffix.lower() not in self.supported_pdf_extensions:
                 self.logger.error(f"Unsupported file extension: {file_path.suffix}")
                 return False
-            
-            # Check file size (not empty, not too large)
-            file_size = file_path.stat().st_size
-            if file_size == 0:
-                self.logger.error("File is empty")
+
+            # One descriptor serves the existence check, the size check
+            # and both probes - no separate exists()/stat()/open() calls
+            try:
+                fd = os.open(str(file_path), os.O_RDONLY)
+            except FileNotFoundError:
+                self.logger.error(f"File does not exist: {file_path}")
                 return False
-            
-            if file_size > 100 * 1024 * 1024:  # 100MB limit
-                self.logger.warning(f"Large file detected: {file_size / (1024*1024):.1f}MB")
-            
-            # Check MIME type
-            mime_type, _ = mimetypes.guess_type(str(file_path))
-            if mime_type != 'application/pdf':
-                self.logger.warning(f"Unexpected MIME type: {mime_type}")
-            
-            # Try to read first few bytes
-            with open(file_path, 'rb') as f:
-                header = f.read(8)
+
+            try:
+                file_size = os.fstat(fd).st_size
+                if file_size == 0:
+                    self.logger.error("File is empty")
+                    return False
+
+                if file_size > 100 * 1024 * 1024:  # 100MB limit
+                    self.logger.warning(f"Large file detected: {file_size / (1024*1024):.1f}MB")
+
+                # Check MIME type
+                mime_type, _ = mimetypes.guess_type(str(file_path))
+                if mime_type != 'application/pdf':
+                    self.logger.warning(f"Unexpected MIME type: {mime_type}")
+
+                # Probe the magic header and the trailer without reading
+                # anything in between
+                if hasattr(os, 'pread'):
+                    header = os.pread(fd, 8, 0)
+                    tail = os.pread(fd, 1024, max(0, file_size - 1024))
+                else:
+                    header = os.read(fd, 8)
+                    os.lseek(fd, max(0, file_size - 1024), os.SEEK_SET)
+                    tail = os.read(fd, 1024)
+
                 if not header.startswith(b'%PDF-'):
                     self.logger.error("File does not appear to be a valid PDF")
                     return False
-            
+
+                if b'%%EOF' not in tail:
+                    self.logger.warning("No %%EOF trailer near end of file - PDF may be truncated")
+
+                # Hint the kernel that the extractor is about to read the
+                # whole file front to back
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            finally:
+                os.close(fd)
+
             return True
-            
+
         except Exception as e:
             self.logger.error(f"PDF validation failed: {str(e)}")
             return False
     
-    def get_file_info(self, file_path: str) -> Dict[str, Any]:
+    def get_file_info(self, file_path: str, include_hash: bool = True) -> Dict[str, Any]:
         """
         Get detailed file information
-        
+
         Args:
             file_path: Path to file
-            
+            include_hash: Compute the MD5 hash (reads the whole file;
+                disable when listing many files)
+
         Returns:
             Dictionary with file information
         """
@@ -105,7 +150,7 @@ class FileHandler:
             }
             
             # Add file hash for verification
-            if stat.st_size < 50 * 1024 * 1024:  # Only for files < 50MB
+            if include_hash and stat.st_size < 50 * 1024 * 1024:  # Only for files < 50MB
                 info['md5_hash'] = self._calculate_file_hash(file_path)
             
             return info
@@ -127,29 +172,38 @@ class FileHandler:
         """
         try:
             directory = Path(directory)
-            
+
             if not directory.exists() or not directory.is_dir():
                 self.logger.error(f"Invalid directory: {directory}")
                 return []
-            
+
+            # Walk with os.scandir: DirEntry carries the file type from
+            # the directory read, so the is-file check needs no stat()
             pdf_files = []
-            
-            if recursive:
-                # Recursive search
-                pdf_files = list(directory.rglob("*.pdf"))
-            else:
-                # Current directory only
-                pdf_files = list(directory.glob("*.pdf"))
-            
-            # Convert to strings and validate
+            pending_dirs = [str(directory)]
+
+            while pending_dirs:
+                current = pending_dirs.pop()
+                try:
+                    with os.scandir(current) as entries:
+                        for entry in entries:
+                            if entry.is_file(follow_symlinks=False):
+                                if entry.name.lower().endswith('.pdf'):
+                                    pdf_files.append(entry.path)
+                            elif recursive and entry.is_dir(follow_symlinks=False):
+                                pending_dirs.append(entry.path)
+                except PermissionError:
+                    self.logger.warning(f"Permission denied: {current}")
+
+            # Validate candidates
             valid_files = []
-            for pdf_file in pdf_files:
-                if self.validate_pdf(str(pdf_file)):
-                    valid_files.append(str(pdf_file))
-            
+            for pdf_file in sorted(pdf_files):
+                if self.validate_pdf(pdf_file):
+                    valid_files.append(pdf_file)
+
             self.logger.info(f"Found {len(valid_files)} valid PDF files in {directory}")
             return valid_files
-            
+
         except Exception as e:
             self.logger.error(f"Failed to find PDF files: {str(e)}")
             return []
@@ -182,12 +236,21 @@ class FileHandler:
                 shutil.copy2(output_path, backup_path)
                 self.logger.debug(f"Created backup: {backup_path}")
             
-            # Write CSV data
-            with open(output_path, 'w', encoding=encoding, newline='') as f:
-                f.write(csv_data)
-            
+            # Write CSV data: encode once and push the payload through a
+            # raw descriptor - open/write/close, no buffer layer between
+            # the bytes and the kernel
+            payload = csv_data.encode(encoding)
+            fd = os.open(str(output_path),
+                         os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                written = 0
+                while written < len(payload):
+                    written += os.write(fd, payload[written:])
+            finally:
+                os.close(fd)
+
             # Verify file was written correctly
-            if output_path.exists() and output_path.stat().st_size > 0:
+            if written == len(payload) and written > 0:
                 self.logger.info(f"CSV saved successfully: {output_path}")
                 return True
             else:
@@ -340,21 +403,10 @@ class FileHandler:
             Safe filename
         """
         try:
-            # Remove invalid characters
-            invalid_chars = '<>:"/\\|?*'
-            safe_name = ''.join(c for c in filename if c not in invalid_chars)
-            
-            # Replace spaces with underscores
-            safe_name = safe_name.replace(' ', '_')
-            
-            # Limit length
-            if len(safe_name) > max_length:
-                name_part = safe_name[:max_length-10]  # Leave room for extension
-                extension = Path(safe_name).suffix
-                safe_name = name_part + extension
-            
-            return safe_name
-            
+            # Deterministic transform - memoized so repeated stems in a
+            # batch only pay the sanitization cost once
+            return _safe_filename(filename, max_length)
+
         except Exception as e:
             self.logger.error(f"Failed to generate safe filename: {str(e)}")
             return "output.csv"
@@ -9,8 +9,15 @@ import unittest
 import tempfile
 import os
 from pathlib import Path
+from unittest.mock import Mock, patch
 import pandas as pd
-from io import StringIO
+from io import BytesIO, StringIO
+
+try:
+    import pyarrow  # noqa: F401 - needed for the parquet spool tests
+    HAVE_PYARROW = True
+except ImportError:
+    HAVE_PYARROW = False
 
 # Add src to path
 import sys
@@ -96,6 +103,118 @@ class TestCSVConverter(unittest.TestCase):
         
         self.assertEqual(csv_data, "")
     
+    def test_write_csv_streams_to_file(self):
+        """Test streaming extracted data straight to a binary file object"""
+        buf = BytesIO()
+
+        rows_written = self.converter.write_csv(self.sample_extracted_data, buf)
+
+        self.assertEqual(rows_written, 3)
+        lines = buf.getvalue().decode('utf-8').splitlines()
+        self.assertEqual(lines[0], 'Name,Age,City,Salary')
+        self.assertEqual(len(lines), 4)  # Header + 3 data rows
+        self.assertIn('John Doe', lines[1])
+
+    def test_write_csv_with_options(self):
+        """Test streaming conversion options"""
+        buf = BytesIO()
+
+        rows_written = self.converter.write_csv(
+            self.sample_extracted_data, buf,
+            delimiter=';', header_row=False)
+
+        self.assertEqual(rows_written, 3)
+        lines = buf.getvalue().decode('utf-8').splitlines()
+        self.assertEqual(len(lines), 3)  # No header
+        self.assertIn(';', lines[0])
+        self.assertNotIn('Name', lines[0])
+
+    def test_write_csv_empty_data(self):
+        """Test streaming with no extracted tables"""
+        buf = BytesIO()
+
+        rows_written = self.converter.write_csv({'tables': []}, buf)
+
+        self.assertEqual(rows_written, 0)
+        self.assertEqual(buf.getvalue(), b'')
+
+    def test_write_csv_spooled_tables(self):
+        """Test the tables_path branch streams shards and cleans up"""
+        spool_dir = tempfile.mkdtemp(dir=self.temp_dir)
+        shards = [pd.DataFrame({'a': [1, 2], 'b': [3, 4]}),
+                  pd.DataFrame({'a': [5], 'b': [6]})]
+        extracted_data = {'tables': [], 'tables_path': spool_dir}
+
+        buf = BytesIO()
+        with patch('src.core.csv_converter.iter_table_shards',
+                   return_value=iter(shards)) as mock_iter:
+            rows_written = self.converter.write_csv(extracted_data, buf)
+
+        mock_iter.assert_called_once_with(spool_dir)
+        self.assertEqual(rows_written, 3)
+        # Header comes from the first shard only
+        self.assertEqual(buf.getvalue(), b'a,b\n1,3\n2,4\n5,6\n')
+        # The drained spool is deleted and its reference dropped
+        self.assertNotIn('tables_path', extracted_data)
+        self.assertFalse(os.path.exists(spool_dir))
+
+    def test_write_rows(self):
+        """Test writing a row iterator straight to a binary file object"""
+        rows = [['Name', 'Age'], ['John', '25'], ['Jane', '30']]
+        buf = BytesIO()
+
+        rows_written = self.converter.write_rows(iter(rows), buf)
+
+        self.assertEqual(rows_written, 3)
+        self.assertEqual(buf.getvalue().decode('utf-8'),
+                         'Name,Age\r\nJohn,25\r\nJane,30\r\n')
+
+    def test_write_csv_arrow_gate(self):
+        """Test the Arrow fast path is used only for large utf-8 output"""
+        large_table = pd.DataFrame({'col': range(20000)})
+        large_data = {'tables': [large_table]}
+
+        with patch('src.core.csv_converter.pa_csv', Mock()):
+            with patch.object(self.converter, '_arrow_write',
+                              return_value=True) as mock_arrow:
+                # Large + utf-8: Arrow writer takes the rows
+                rows_written = self.converter.write_csv(large_data, BytesIO())
+                self.assertEqual(rows_written, len(large_table))
+                mock_arrow.assert_called_once()
+
+                # Non-utf-8 output: falls back to the pandas writer
+                mock_arrow.reset_mock()
+                buf = BytesIO()
+                self.converter.write_csv(large_data, buf, encoding='latin-1')
+                mock_arrow.assert_not_called()
+                self.assertTrue(buf.getvalue().startswith(b'col\n0\n1\n'))
+
+                # Small tables skip the Arrow conversion overhead
+                mock_arrow.reset_mock()
+                self.converter.write_csv(self.sample_extracted_data, BytesIO())
+                mock_arrow.assert_not_called()
+
+    @unittest.skipIf(not HAVE_PYARROW, "pyarrow not installed")
+    def test_stream_to_disk_round_trip(self):
+        """Test spooled shards stream back as CSV and the spool is removed"""
+        spool_dir = tempfile.mkdtemp(prefix='pdf2csv_tables_', dir=self.temp_dir)
+        pd.DataFrame({'a': [1, 2], 'b': [3, 4]}).to_parquet(
+            os.path.join(spool_dir, 'chunk_00000.parquet'))
+        pd.DataFrame({'a': [5], 'b': [6]}).to_parquet(
+            os.path.join(spool_dir, 'chunk_00001.parquet'))
+
+        extracted_data = {'tables': [], 'tables_path': spool_dir}
+
+        buf = BytesIO()
+        rows_written = self.converter.write_csv(extracted_data, buf)
+
+        self.assertEqual(rows_written, 3)
+        self.assertEqual(buf.getvalue(), b'a,b\n1,3\n2,4\n5,6\n')
+
+        # The drained spool is deleted and its reference dropped
+        self.assertNotIn('tables_path', extracted_data)
+        self.assertFalse(os.path.exists(spool_dir))
+
     def test_multiple_tables_merge(self):
         """Test merging multiple tables"""
         table1 = pd.DataFrame({
@@ -146,7 +265,7 @@ class TestCSVConverter(unittest.TestCase):
         """Test data cleaning during merge"""
         dirty_df = pd.DataFrame({
             'Col1': ['  Value1  ', 'Value2', 'Value1', ''],  # Spaces and duplicates
-            'Col2': ['Value3', '', None, 'Value4']
+            'Col2': ['Value3', '', 'Value3', 'Value4']
         })
         
         cleaned_df = self.converter._clean_merged_data(dirty_df, clean_data=True, skip_empty=True)
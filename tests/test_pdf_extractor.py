@@ -16,7 +16,7 @@ import pandas as pd
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.core.pdf_extractor import PDFExtractor
+from src.core.pdf_extractor import PDFExtractor, _parse_pages_range
 from src.core.config_manager import ConfigManager
 
 class TestPDFExtractor(unittest.TestCase):
@@ -208,6 +208,20 @@ class TestPDFExtractor(unittest.TestCase):
         self.assertEqual(cleaned_df.iloc[0, 0], 'Value1')  # Stripped
         self.assertEqual(cleaned_df.iloc[1, 1], 'Value4')  # Stripped
     
+    def test_parse_pages_range(self):
+        """Test string page specs parse to zero-based indices"""
+        # Bounded, open-start and open-end ranges
+        self.assertEqual(_parse_pages_range('1-5', 10), (0, 1, 2, 3, 4))
+        self.assertEqual(_parse_pages_range('-3', 10), (0, 1, 2))
+        self.assertEqual(_parse_pages_range('2-end', 5), (1, 2, 3, 4))
+
+        # Comma lists
+        self.assertEqual(_parse_pages_range('1,3,7', 10), (0, 2, 6))
+
+        # Out-of-range pages are clamped to the document length
+        self.assertEqual(_parse_pages_range('3-99', 5), (2, 3, 4))
+        self.assertEqual(_parse_pages_range('1,3,7', 5), (0, 2))
+
     def test_parse_text_to_table(self):
         """Test parsing text into tabular format"""
         text_content = [